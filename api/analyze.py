@@ -1,12 +1,24 @@
-from http.server import BaseHTTPRequestHandler
-import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import logging
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 import uuid
-import urllib.parse
+import os
+import atexit
+import gzip
+import hashlib
+import sqlite3
+import random
+import reprlib
+import statistics
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -15,23 +27,203 @@ logger = logging.getLogger(__name__)
 # FinChat API Configuration
 FINCHAT_URL = "https://finchat-api.adgo.dev"
 FINCHAT_BACKOFF_SECONDS = 5
+FINCHAT_POLL_INITIAL_SECONDS = 0.5
+FINCHAT_POLL_MULTIPLIER = 1.5
+FINCHAT_POLL_JITTER = 0.2  # +/- fraction applied to each poll interval
+FINCHAT_CONNECT_TIMEOUT_SECONDS = 5
+FINCHAT_READ_TIMEOUT_SECONDS = 30
+FINCHAT_RESULT_TIMEOUT_SECONDS = 50  # Give up on a sentence before Vercel kills the function at 60s
+FINCHAT_CIRCUIT_FAILURE_THRESHOLD = 5
+FINCHAT_CIRCUIT_OPEN_SECONDS = 30
+FINCHAT_PROGRESS_LOG_SECONDS = 15  # How often the poll loops report that they are still waiting
+FINCHAT_ERROR_BODY_MAX_BYTES = 2048  # Enough of an error body to diagnose it without logging a whole HTML error page
+FINCHAT_ENDPOINT_MISSING_STATUSES = (404, 405, 501)  # Statuses meaning FinChat doesn't offer an optional endpoint at all
+FINCHAT_RETRY_STATUSES = (429, 500, 502, 503, 504)  # Transient statuses worth trying again
+FINCHAT_LONGPOLL_SECONDS = 55  # Server-side hold time requested from the session wait endpoint
+FINCHAT_LONGPOLL_READ_MARGIN_SECONDS = 5  # Read timeout slack beyond the requested hold
+FINCHAT_POOL_SIZE = int(os.environ.get("FINCHAT_POOL_SIZE", "50"))  # Max keep-alive connections to FinChat
+FINCHAT_MAX_REQUESTS_PER_SECOND = float(os.environ.get("FINCHAT_MAX_REQUESTS_PER_SECOND", "0"))  # 0 disables client-side rate limiting
+# The session wait, write-aid, batch write-aid and single-chat endpoints are not in the documented API;
+# probe them only when asked to, so the default path is the documented session -> chat -> result flow
+FINCHAT_EXPERIMENTAL_ENDPOINTS = os.environ.get("FINCHAT_EXPERIMENTAL_ENDPOINTS", "").lower() in ("1", "true", "yes")
+
+# write-aid-1 command; sentence and paragraph are substituted as JSON string literals so quotes and newlines are escaped
+WRITE_AID_MAGIC_TEMPLATE = 'cot write-aid-1 $sentence:{sentence} $paragraph:{paragraph} $author:{author}'
+
+# Sentence splitting: break after . ! ? unless the period belongs to a common abbreviation
+SENTENCE_ABBREVIATIONS = ("Mr.", "Mrs.", "Ms.", "Dr.", "Prof.", "St.", "vs.", "e.g.", "i.e.")
+SENTENCE_BOUNDARY_RE = re.compile(
+    "".join(rf"(?<!\b{re.escape(abbr)})" for abbr in SENTENCE_ABBREVIATIONS) + r"(?<=[.!?])\s+"
+)
+
+# Sentence result cache configuration
+SENTENCE_CACHE_MAX_ENTRIES = 4096
+SENTENCE_CACHE_TTL_SECONDS = 3600  # Re-ask FinChat after an hour rather than serving a rewrite forever
+SENTENCE_CACHE_PATH = os.environ.get("SENTENCE_CACHE_PATH")  # Optional SQLite file so cached sentences survive restarts
+FINCHAT_ETAG_CACHE_MAX_ENTRIES = 64  # Per-URL validators kept for conditional GETs
+DEFAULT_AUTHOR = "EB White"
+GZIP_MIN_BYTES = 1024  # Smaller JSON bodies aren't worth compressing
+RESPONSE_LOG_TAIL_LINES = 50  # Log lines returned to the frontend unless include_logs is set
+PROCESSOR_LOG_MAX_LINES = 2000  # Oldest frontend log lines are dropped past this
+PARALLEL_MAX_WORKERS = 8  # Upper bound on sentences sent to FinChat at once when a paragraph opts into parallel processing
+SENTENCE_EXECUTOR_WORKERS = int(os.environ.get("SENTENCE_EXECUTOR_WORKERS", "16"))  # Threads shared by every parallel paragraph in the worker
+
+# Fixed response headers, built once rather than per response
+JSON_RESPONSE_HEADERS = (
+    ('Content-Type', 'application/json'),
+    ('Access-Control-Allow-Origin', '*'),
+)
+PREFLIGHT_HEADERS = (
+    ('Access-Control-Allow-Origin', '*'),
+    ('Access-Control-Allow-Methods', 'GET, POST, OPTIONS'),
+    ('Access-Control-Allow-Headers', 'Content-Type'),
+    ('Access-Control-Max-Age', '86400'),  # Browsers reuse the preflight instead of repeating it before every POST
+    ('Content-Length', '0'),  # Preflight has no body; the length lets HTTP/1.1 clients keep the connection
+)
+
+def create_http_session(retries: bool = True) -> requests.Session:
+    """Create a keep-alive session so repeated FinChat polls reuse one TCP/TLS connection.
+    
+    With `retries=False` nothing is retried at the transport level, for callers that retry on their own schedule.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,  # Only one host (FinChat) is ever called
+        pool_maxsize=FINCHAT_POOL_SIZE,
+        max_retries=Retry(
+            total=5,
+            connect=3,
+            read=3,
+            status=3,
+            backoff_factor=0.5,
+            status_forcelist=list(FINCHAT_RETRY_STATUSES),
+            # POST stays out: a replayed session/chat create would duplicate work on FinChat
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ) if retries else 0,
+    )
+    session.mount('https://', adapter)
+    session.headers['Accept'] = 'application/json'  # Every FinChat endpoint we call returns JSON
+    return session
+
+# Shared across requests so the connection pool survives for the life of the worker
+http_session = create_http_session()
+atexit.register(http_session.close)  # Close pooled keep-alive sockets cleanly when the worker shuts down
+# Deadline-bound polls go through this one: urllib3's backoff and Retry-After sleeps would carry them past result_timeout
+poll_http_session = create_http_session(retries=False)
+atexit.register(poll_http_session.close)
+
+# Caps in-flight FinChat calls at the pool size so concurrent jobs never open throwaway connections
+finchat_request_slots = threading.BoundedSemaphore(FINCHAT_POOL_SIZE)
+
+# Bounded repr for debug payload logs: stops at the limit instead of rendering a whole paragraph first
+payload_repr = reprlib.Repr()
+payload_repr.maxstring = 200
+payload_repr.maxother = 200
+
+def poll_delays(initial: float = FINCHAT_POLL_INITIAL_SECONDS, maximum: float = FINCHAT_BACKOFF_SECONDS) -> Iterator[float]:
+    """Yield exponentially growing poll intervals: 0.5s -> 0.75s -> 1.125s ... capped at `maximum`.
+    
+    Each interval is jittered so sentences polling concurrently do not hit FinChat in lockstep.
+    """
+    delay = initial
+    while True:
+        yield delay * random.uniform(1 - FINCHAT_POLL_JITTER, 1 + FINCHAT_POLL_JITTER)
+        delay = min(delay * FINCHAT_POLL_MULTIPLIER, maximum)
+
+class FinChatAPIError(ValueError):
+    """FinChat answered with an error status"""
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+class CircuitBreaker:
+    """Fail fast once FinChat has returned too many consecutive 5xx responses or network errors"""
+    def __init__(self, failure_threshold: int = FINCHAT_CIRCUIT_FAILURE_THRESHOLD, open_seconds: float = FINCHAT_CIRCUIT_OPEN_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+    
+    def is_open(self) -> bool:
+        return time.monotonic() < self._open_until
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.failure_threshold:
+                self._open_until = time.monotonic() + self.open_seconds
+                self._consecutive_failures = 0
+                logger.error("🚫 FinChat circuit opened for %ds after %d consecutive failures", self.open_seconds, self.failure_threshold)
+
+# Shared so every request in the worker stops calling FinChat during an outage
+finchat_circuit = CircuitBreaker()
+
+class RateLimiter:
+    """Token bucket pacing FinChat calls to `rate` per second, allowing bursts of up to `burst`; a rate of 0 disables it"""
+    def __init__(self, rate: float = FINCHAT_MAX_REQUESTS_PER_SECOND, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a call may be sent"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+# Shared so concurrent sentences and requests draw from one budget instead of pacing themselves
+finchat_rate_limiter = RateLimiter()
 
 class FinChatClient:
-    def __init__(self, log_collector=None):
-        self.base_url = FINCHAT_URL
-        self.backoff_seconds = FINCHAT_BACKOFF_SECONDS
-        self.log_collector = log_collector or []
+    base_url = FINCHAT_URL
+    backoff_seconds = FINCHAT_BACKOFF_SECONDS
+    timeout = (FINCHAT_CONNECT_TIMEOUT_SECONDS, FINCHAT_READ_TIMEOUT_SECONDS)
+    result_timeout = FINCHAT_RESULT_TIMEOUT_SECONDS
+    # Each starts off (False) unless FINCHAT_EXPERIMENTAL_ENDPOINTS is set, in which case None means untried
+    longpoll_supported: Optional[bool] = None if FINCHAT_EXPERIMENTAL_ENDPOINTS else False  # Session wait endpoint: None until it first answers, False once ruled out
+    aggregate_supported: Optional[bool] = None if FINCHAT_EXPERIMENTAL_ENDPOINTS else False  # Likewise for the single-call write-aid endpoint
+    chat_detail_supported: Optional[bool] = None if FINCHAT_EXPERIMENTAL_ENDPOINTS else False  # And for the single-chat GET (the documented API only lists a session's chats)
+    batch_supported: Optional[bool] = None if FINCHAT_EXPERIMENTAL_ENDPOINTS else False  # And for the batch write-aid endpoint
+    recent_result_seconds: "deque[float]" = deque(maxlen=16)  # How long recent sessions took to produce a result_id
+    
+    def __init__(self, log_collector=None, session: Optional[requests.Session] = None, poll_session: Optional[requests.Session] = None):
+        self.log_collector = log_collector if log_collector is not None else []
+        self.session = session or http_session
+        self.poll_session = poll_session or poll_http_session
+        self.circuit = finchat_circuit
+        self.rate_limiter = finchat_rate_limiter
+        self._paragraph_literal = ("", '""')  # (paragraph, JSON literal) of the last paragraph sent
+        self._etag_cache: "OrderedDict[str, Tuple[str, Dict[Any, Any]]]" = OrderedDict()  # url -> (ETag, parsed body)
+        self._etag_lock = threading.Lock()
     
     def log_and_store(self, message: str):
         """Log message and store for frontend"""
         logger.info(message)
         self.log_collector.append(message)
     
-    def call_remote(self, method: str, full_url: str, **kwargs) -> Dict[Any, Any]:
-        """Generic HTTP caller for FinChat API with cache-busting headers"""
-        self.log_and_store(f"🌐 FINCHAT API CALL: {method.upper()} {full_url}")
-        if kwargs:
-            self.log_and_store(f"📤 Request payload: {str(kwargs)[:200]}...")  # Truncate for readability
+    def call_remote(self, method: str, full_url: str, request_timeout: Optional[Tuple[float, float]] = None, retry: bool = True, **kwargs) -> Dict[Any, Any]:
+        """Generic HTTP caller for FinChat API with cache-busting headers; `retry=False` skips the transport-level retries"""
+        logger.debug("🌐 FINCHAT API CALL: %s %s", method.upper(), full_url)
+        if kwargs and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📤 Request payload: %s", payload_repr.repr(kwargs))
         
         # Add cache-busting headers
         headers = {
@@ -40,25 +232,72 @@ class FinChatClient:
             'Expires': '0'
         }
         
-        if method == "get":
-            res = requests.get(full_url, params=kwargs, headers=headers)
-        elif method in ["post", "put"]:
-            res = requests.request(method, full_url, json=kwargs, headers=headers)
-        else:
+        if method not in ["get", "post", "put"]:
             raise ValueError(f"Unsupported method {method}")
         
-        self.log_and_store(f"📥 Response status: {res.status_code}")
+        if self.circuit.is_open():
+            raise RuntimeError(f"FinChat circuit open after repeated failures; skipping {method.upper()} {full_url}")
+        
+        # Revalidate repeated polls of the same URL instead of re-downloading an unchanged body
+        # (_cache_bust changes on every call, so it is not part of what identifies the resource)
+        revalidate = method == "get" and set(kwargs) <= {'_cache_bust'}
+        cached = self._cached_get(full_url) if revalidate else None
+        if cached is not None:
+            headers['If-None-Match'] = cached[0]
+        
+        try:
+            self.rate_limiter.acquire()
+            http = self.session if retry else self.poll_session
+            with finchat_request_slots:
+                if method == "get":
+                    res = http.get(full_url, params=kwargs, headers=headers, timeout=request_timeout or self.timeout)
+                else:
+                    res = http.request(method, full_url, json=kwargs, headers=headers, timeout=request_timeout or self.timeout)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            self.circuit.record_failure()
+            raise
+        
+        logger.debug("📥 Response status: %s", res.status_code)
+        
+        if res.status_code >= 500:
+            self.circuit.record_failure()
+        else:
+            self.circuit.record_success()
+        
+        if res.status_code == 304 and cached is not None:
+            return cached[1]
         
         if res.status_code >= 400:
+            # Only decode the body as text on the error path, and only as much of it as is worth logging
+            error_body = res.content[:FINCHAT_ERROR_BODY_MAX_BYTES].decode('utf-8', 'replace')
             error_msg = f"❌ FINCHAT API ERROR: {method} {full_url} failed with status {res.status_code}"
             self.log_and_store(error_msg)
-            self.log_and_store(f"❌ Error response: {res.text}")
-            raise ValueError(f"Failed to call {method} {full_url}:\nstatus:{res.status_code}\n\n{res.text}")
+            self.log_and_store(f"❌ Error response: {error_body}")
+            raise FinChatAPIError(f"Failed to call {method} {full_url}:\nstatus:{res.status_code}\n\n{error_body}", res.status_code)
         
-        response_data = res.json()
-        self.log_and_store(f"✅ FINCHAT API SUCCESS: {method.upper()} {full_url}")
+        response_data = orjson.loads(res.content)
+        etag = res.headers.get('ETag')
+        if revalidate and etag:
+            self._store_get(full_url, etag, response_data)
+        logger.debug("✅ FINCHAT API SUCCESS: %s %s", method.upper(), full_url)
         return response_data
     
+    def _cached_get(self, full_url: str) -> Optional[Tuple[str, Dict[Any, Any]]]:
+        """Return the (ETag, body) last seen for this URL, if any"""
+        with self._etag_lock:
+            cached = self._etag_cache.get(full_url)
+            if cached is not None:
+                self._etag_cache.move_to_end(full_url)
+            return cached
+    
+    def _store_get(self, full_url: str, etag: str, response_data: Dict[Any, Any]) -> None:
+        """Remember a GET's validator, evicting the least recently used URL past the cap"""
+        with self._etag_lock:
+            self._etag_cache[full_url] = (etag, response_data)
+            self._etag_cache.move_to_end(full_url)
+            while len(self._etag_cache) > FINCHAT_ETAG_CACHE_MAX_ENTRIES:
+                self._etag_cache.popitem(last=False)
+    
     def call_finchat(self, method: str, path: str, **kwargs) -> Dict[Any, Any]:
         """FinChat-specific wrapper with cache busting"""
         full_url = f"{self.base_url}{path}"
@@ -70,34 +309,43 @@ class FinChatClient:
         
         return self.call_remote(method, full_url, **kwargs)
     
-    def wait_till_idle(self, session_id: str, log_at_checks: int = 5) -> None:
-        """Wait for session to complete with dynamic backoff: 30s -> 15s -> 10s -> 5s -> 1s (then stay at 1s)"""
-        self.log_and_store(f"⏳ Waiting for session {session_id} to complete...")
-        check_count = 0
+    def wait_till_idle_longpoll(self, session_id: str, deadline: Optional[float] = None) -> bool:
+        """Block on FinChat's session wait endpoint until the session is idle; False if long-polling is unavailable.
         
-        # Dynamic backoff intervals: start long, decrease as we get closer to completion
-        backoff_intervals = [30, 15, 10, 5, 1]  # seconds - final 1s for responsiveness
+        With `deadline` (a time.monotonic() value), the requested hold and the read timeout both end before it.
+        """
+        if self.longpoll_supported is False:
+            return False
+        read_timeout = FINCHAT_LONGPOLL_SECONDS + FINCHAT_LONGPOLL_READ_MARGIN_SECONDS
+        if deadline is not None:
+            read_timeout = min(read_timeout, deadline - time.monotonic() - FINCHAT_CONNECT_TIMEOUT_SECONDS)
+        hold = int(read_timeout - FINCHAT_LONGPOLL_READ_MARGIN_SECONDS)
+        if hold < 1:
+            return False
+        try:
+            session = self.call_remote(
+                "get", f"{self.base_url}/api/v1/sessions/{session_id}/wait/?timeout={hold}",
+                request_timeout=(FINCHAT_CONNECT_TIMEOUT_SECONDS, read_timeout),
+                retry=False,
+            )
+        except FinChatAPIError as e:
+            if not self.optional_endpoint_missing("longpoll_supported", e):
+                raise
+            self.log_and_store("ℹ️ FinChat session wait endpoint unavailable, falling back to polling")
+            return False
+        FinChatClient.longpoll_supported = True
+        return session.get("status") == "idle"
+    
+    def optional_endpoint_missing(self, flag: str, error: FinChatAPIError) -> bool:
+        """Whether an error from an optional FinChat endpoint means it isn't offered, switching it off for the process if so.
         
-        while True:
-            session = self.call_finchat(method="get", path=f"/api/v1/sessions/{session_id}/")
-            check_count += 1
-            session_status = session["status"]
-            
-            if session_status == "idle":
-                self.log_and_store(f"✅ Session {session_id} is now idle (completed)")
-                break
-            
-            # Determine current backoff interval based on check count
-            if check_count <= len(backoff_intervals):
-                current_backoff = backoff_intervals[check_count - 1]
-            else:
-                current_backoff = backoff_intervals[-1]  # Stay at 1 second after initial intervals
-                
-            if check_count % log_at_checks == 0:
-                self.log_and_store(f"⏳ Continuing to check session {session_id} for idle. Currently {session_status}. (Checked {check_count} times)")
-            
-            self.log_and_store(f"⏳ Next check in {current_backoff} seconds...")
-            time.sleep(current_backoff)
+        Until the endpoint has answered once, any error status counts, since a missing route may answer 400 or 401 rather
+        than 404. Once it has worked, only FINCHAT_ENDPOINT_MISSING_STATUSES do and other errors are the caller's to raise.
+        """
+        if getattr(FinChatClient, flag) and error.status_code not in FINCHAT_ENDPOINT_MISSING_STATUSES:
+            return False
+        setattr(FinChatClient, flag, False)
+        return True
     
     def create_session(self) -> str:
         """Create a new FinChat session"""
@@ -112,20 +360,28 @@ class FinChatClient:
         self.log_and_store(f"✨ Created FinChat session: {session_id}")
         return session_id
     
-    def send_write_aid_request(self, session_id: str, sentence: str, full_paragraph: str, author: str) -> None:
-        """Send write-aid-1 request with single sentence and full paragraph"""
-        magic_string = (
-            f"cot write-aid-1 "
-            f'$sentence:"{sentence}" '
-            f'$paragraph:"{full_paragraph}" '
-            f"$author:{author}"
+    def paragraph_literal(self, full_paragraph: str) -> str:
+        """JSON-escape the paragraph, reusing the previous literal while the paragraph is unchanged"""
+        # Read and replace the (paragraph, literal) pair as one tuple so concurrent jobs never mix them up
+        cached = self._paragraph_literal
+        if cached[0] != full_paragraph:
+            cached = (full_paragraph, orjson.dumps(full_paragraph).decode('utf-8'))
+            self._paragraph_literal = cached
+        return cached[1]
+    
+    def send_write_aid_request(self, session_id: str, sentence: str, full_paragraph: str, author: str) -> Optional[str]:
+        """Send write-aid-1 request with single sentence and full paragraph; returns the created chat's id"""
+        magic_string = WRITE_AID_MAGIC_TEMPLATE.format(
+            sentence=orjson.dumps(sentence).decode('utf-8'),
+            paragraph=self.paragraph_literal(full_paragraph),
+            author=author,
         )
         
         self.log_and_store(f"💬 Sending write-aid-1 request to session {session_id}")
         self.log_and_store(f"📝 Single sentence: {sentence[:50]}...")
         self.log_and_store(f"📝 Full paragraph: {full_paragraph[:100]}...")
         
-        self.call_finchat(
+        chat = self.call_finchat(
             method="post",
             path="/api/v1/chats/",
             session=session_id,
@@ -134,60 +390,166 @@ class FinChatClient:
         )
         
         self.log_and_store(f"📨 Write-aid request sent to session {session_id}")
+        return chat.get("id")
     
-    def get_result(self, session_id: str) -> Optional[Dict[Any, Any]]:
-        """Get analysis result with retry logic"""
-        logger.info(f"🔍 Getting results for session {session_id}")
+    def run_write_aid(self, sentence: str, full_paragraph: str, author: str, session_id: Optional[str] = None) -> Optional[Tuple[str, Optional[Dict[Any, Any]]]]:
+        """Run create/send/wait/fetch as one call to FinChat's write-aid endpoint; None if the endpoint is unavailable"""
+        if self.aggregate_supported is False:
+            return None
+        payload = {
+            "sentence": sentence,
+            "paragraph": full_paragraph,
+            "author": author,
+            "client_id": "parsec-backtesting",
+            "data_source": "alpha_vantage",
+        }
+        if session_id is not None:
+            payload["session"] = session_id
+        try:
+            response = self.call_remote(
+                "post", f"{self.base_url}/api/v1/write-aid/",
+                request_timeout=(FINCHAT_CONNECT_TIMEOUT_SECONDS, self.result_timeout),
+                **payload,
+            )
+        except FinChatAPIError as e:
+            if not self.optional_endpoint_missing("aggregate_supported", e):
+                raise
+            self.log_and_store("ℹ️ FinChat write-aid endpoint unavailable, falling back to the session/chat/result calls")
+            return None
+        except orjson.JSONDecodeError:
+            response = None
+        # A route that answers 200 with some other body (an error object, a catch-all page) is as good as missing
+        if not isinstance(response, dict) or "session_id" not in response:
+            FinChatClient.aggregate_supported = False
+            self.log_and_store("ℹ️ FinChat write-aid endpoint returned an unexpected body, falling back to the session/chat/result calls")
+            return None
+        FinChatClient.aggregate_supported = True
+        return response["session_id"], response.get("result")
+    
+    def run_write_aid_batch(self, sentences: List[str], full_paragraph: str, author: str) -> Optional[Tuple[str, List[Optional[Dict[Any, Any]]]]]:
+        """Improve every sentence against the same paragraph in one call; None if the batch endpoint is unavailable"""
+        if self.batch_supported is False:
+            return None
+        try:
+            response = self.call_remote(
+                "post", f"{self.base_url}/api/v1/write-aid/batch/",
+                request_timeout=(FINCHAT_CONNECT_TIMEOUT_SECONDS, self.result_timeout),
+                sentences=sentences,
+                paragraph=full_paragraph,
+                author=author,
+                client_id="parsec-backtesting",
+                data_source="alpha_vantage",
+            )
+        except FinChatAPIError as e:
+            if not self.optional_endpoint_missing("batch_supported", e):
+                raise
+            self.log_and_store("ℹ️ FinChat batch write-aid endpoint unavailable, falling back to one call per sentence")
+            return None
+        except orjson.JSONDecodeError:
+            response = None
+        # As with run_write_aid, only a body that checks out proves the endpoint; anything else rules it out
+        results = response.get("results") if isinstance(response, dict) and "session_id" in response else None
+        if not isinstance(results, list):
+            FinChatClient.batch_supported = False
+            self.log_and_store(f"⚠️ Batch write-aid returned {type(results).__name__} instead of a result list, falling back")
+            return None
+        if len(results) != len(sentences):
+            FinChatClient.batch_supported = False
+            self.log_and_store(f"⚠️ Batch write-aid returned {len(results)} results for {len(sentences)} sentences, falling back")
+            return None
+        FinChatClient.batch_supported = True
+        return response["session_id"], results
+    
+    def result_poll_delays(self) -> Iterator[float]:
+        """Poll schedule for get_result, adapted to how long recent sessions took to produce a result"""
+        if not self.recent_result_seconds:
+            yield from poll_delays(maximum=self.backoff_seconds)
+            return
+        typical = statistics.median(self.recent_result_seconds)
+        # Sleep through most of a typical wait, then check at a quarter of it (within the usual bounds)
+        yield 0.8 * typical
+        yield from poll_delays(initial=min(max(FINCHAT_POLL_INITIAL_SECONDS, 0.25 * typical), self.backoff_seconds), maximum=self.backoff_seconds)
+    
+    def poll_latest_chat(self, session_id: str, chat_id: Optional[str], poll_timeout: Tuple[float, float]) -> Dict[Any, Any]:
+        """One get_result poll: our chat (or, without `chat_id`, the session's latest chat), without transport retries"""
+        latest_message = None
+        if chat_id and self.chat_detail_supported is not False:
+            # A single-object fetch stays small however many chats the shared session accumulates
+            try:
+                latest_message = self.call_finchat("get", f"/api/v1/chats/{chat_id}/", request_timeout=poll_timeout, retry=False)
+                FinChatClient.chat_detail_supported = True
+            except FinChatAPIError as e:
+                # Unlike the other optional endpoints, only a missing-route status rules this one out: it is
+                # polled many times per sentence, so a stray 5xx or 401 on the first try shouldn't disable it
+                if e.status_code in FINCHAT_ENDPOINT_MISSING_STATUSES:
+                    FinChatClient.chat_detail_supported = False
+                    self.log_and_store("ℹ️ FinChat chat detail endpoint unavailable, listing session chats instead")
+                elif self.chat_detail_supported:
+                    raise
+                else:
+                    self.log_and_store(f"ℹ️ FinChat chat detail returned {e.status_code}, listing session chats for this poll")
+        if latest_message is None:
+            chats = self.call_finchat("get", f"/api/v1/chats/?session_id={session_id}", request_timeout=poll_timeout, retry=False)["results"]
+            # Our chat is the newest one in the session; match on id as well where the listing includes it
+            latest_message = next((chat for chat in chats if chat_id and chat.get("id") == chat_id), chats[-1] if chats else {})
+        return latest_message
+    
+    def get_result(self, session_id: str, log_every_seconds: float = FINCHAT_PROGRESS_LOG_SECONDS, chat_id: Optional[str] = None) -> Optional[Dict[Any, Any]]:
+        """Poll the chat (or, without `chat_id`, the session's latest chat) until a result_id appears, then fetch the analysis"""
+        logger.debug("🔍 Getting results for session %s", session_id)
         
-        max_retries = 5
-        retries = 0
+        check_count = 0
         result_id = None
+        started = time.monotonic()
+        deadline = started + self.result_timeout
+        next_progress_log = started + log_every_seconds
         
-        # Get result ID with dynamic backoff
-        logger.info(f"📋 Fetching chat messages to get result_id...")
-        result_backoff_intervals = [10, 8, 6, 3, 1]  # More aggressive since result should be available soon after idle
-        
-        while retries < max_retries and result_id is None:
-            chat_messages = self.call_finchat("get", f"/api/v1/chats/?session_id={session_id}")
-            if chat_messages["results"]:
-                latest_message = chat_messages["results"][-1]
-                result_id = latest_message.get("result_id")
-                if result_id:
-                    logger.info(f"🎯 Found result_id: {result_id}")
-            if result_id is None:
-                retries += 1
-                current_delay = result_backoff_intervals[min(retries - 1, len(result_backoff_intervals) - 1)]
-                logger.warning("⏳ No valid result_id found. Retrying in %d seconds... (%d/%d)", current_delay, retries, max_retries)
-                time.sleep(current_delay)
+        # Get result ID - its presence means the session finished, so no separate idle wait is needed.
+        # Where FinChat supports it, a long-poll returns as soon as the session is idle so the first chat fetch usually hits.
+        try:
+            self.wait_till_idle_longpoll(session_id, deadline)
+        except Exception as e:
+            logger.warning("⚠️ Session long-poll failed, polling chats instead: %s", e)
+        logger.debug("📋 Polling chat messages for result_id...")
+        delays = self.result_poll_delays()
+        while result_id is None:
+            # No single poll may run past the deadline either
+            poll_timeout = (FINCHAT_CONNECT_TIMEOUT_SECONDS, max(1.0, min(FINCHAT_READ_TIMEOUT_SECONDS, deadline - time.monotonic())))
+            # The loop is the retry: a transient failure just costs this poll rather than sleeping past the deadline
+            try:
+                latest_message = self.poll_latest_chat(session_id, chat_id, poll_timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, FinChatAPIError) as e:
+                if isinstance(e, FinChatAPIError) and e.status_code not in FINCHAT_RETRY_STATUSES:
+                    raise
+                logger.warning("⚠️ Chat poll for session %s failed, retrying at the next poll: %s", session_id, e)
+                latest_message = {}
+            check_count += 1
+            result_id = latest_message.get("result_id")
+            if result_id:
+                logger.debug("🎯 Found result_id: %s", result_id)
+                self.recent_result_seconds.append(time.monotonic() - started)
+                break
+            if time.monotonic() >= deadline:
+                break
+            current_delay = min(next(delays), max(0.0, deadline - time.monotonic()))  # Wake for one last check at the deadline
+            if time.monotonic() >= next_progress_log:
+                next_progress_log = time.monotonic() + log_every_seconds
+                logger.debug("⏳ No result_id yet for session %s. Retrying in %.2f seconds... (Checked %d times)", session_id, current_delay, check_count)
+            time.sleep(current_delay)
         
         if result_id is None:
-            logger.error("❌ Max retries reached. Failed to obtain a valid result_id")
+            logger.error("❌ Timed out after %ds. Failed to obtain a valid result_id", self.result_timeout)
             return None
         
-        # Fetch full analysis
-        logger.info(f"📊 Fetching full analysis for result_id: {result_id}")
-        max_retries = 3
-        retries = 0
-        full_analysis = None
-        
-        while retries < max_retries:
-            try:
-                full_analysis = self.call_finchat("get", f"/api/v1/results/{result_id}/")
-                logger.info(f"✅ Successfully retrieved analysis for result_id: {result_id}")
-                break
-            except Exception as e:
-                retries += 1
-                logger.error("⚠️ Analysis fetch attempt %d/%d failed: %s", retries, max_retries, str(e))
-                if retries < max_retries:
-                    # Quick retry backoff for analysis fetching: 3, 2, 1 seconds
-                    analysis_backoff = [3, 2, 1][min(retries - 1, 2)]
-                    logger.info(f"⏳ Retrying analysis fetch in {analysis_backoff} seconds...")
-                    time.sleep(analysis_backoff)
-        
-        if full_analysis is None:
-            logger.error("❌ Failed to fetch analysis after %d retries", max_retries)
+        # Fetch full analysis; transient failures are retried by the session's urllib3 Retry
+        logger.debug("📊 Fetching full analysis for result_id: %s", result_id)
+        try:
+            full_analysis = self.call_finchat("get", f"/api/v1/results/{result_id}/")
+        except Exception as e:
+            logger.error("❌ Failed to fetch analysis for result_id %s: %s", result_id, e)
             return None
         
+        logger.debug("✅ Successfully retrieved analysis for result_id: %s", result_id)
         return full_analysis
     
     def extract_improved_sentence(self, analysis_result: Dict[Any, Any]) -> Optional[str]:
@@ -197,7 +559,7 @@ class FinChatClient:
             if isinstance(analysis_result, dict) and 'content' in analysis_result:
                 improved_sentence = analysis_result['content']
                 if improved_sentence:
-                    logger.info(f"✨ Extracted improved sentence: {improved_sentence}")
+                    logger.info("✨ Extracted improved sentence: %s", improved_sentence)
                     return improved_sentence
                 else:
                     logger.warning("⚠️ Content field is empty")
@@ -207,55 +569,189 @@ class FinChatClient:
                 return None
             
         except Exception as e:
-            logger.error(f"❌ Error extracting improved sentence: {str(e)}")
+            logger.error("❌ Error extracting improved sentence: %s", e)
             return None
 
 class SentenceSplitter:
-    def __init__(self):
-        # Regex pattern for sentence boundaries
-        self.sentence_pattern = r'(?<=[.!?])\s+'
+    sentence_pattern = SENTENCE_BOUNDARY_RE  # Pre-compiled pattern for sentence boundaries
     
     def split_paragraph(self, paragraph: str) -> List[str]:
         """Split paragraph into individual sentences"""
-        sentences = re.split(self.sentence_pattern, paragraph.strip())
-        # Clean and filter empty sentences
-        return [s.strip() for s in sentences if s.strip()]
+        # Boundaries swallow all whitespace between sentences, so the slices need no further stripping
+        return self.split_with_separators(paragraph)[0]
+    
+    def split_with_separators(self, paragraph: str) -> Tuple[List[str], List[str]]:
+        """Split paragraph into sentences plus the whitespace after each boundary, so it can be rebuilt exactly"""
+        paragraph = paragraph.strip()
+        if not paragraph:
+            return [], []
+        sentences, separators, start = [], [], 0
+        for boundary in self.sentence_pattern.finditer(paragraph):
+            sentences.append(paragraph[start:boundary.start()])
+            separators.append(boundary.group())
+            start = boundary.end()
+        sentences.append(paragraph[start:])
+        return sentences, separators
+    
+    @staticmethod
+    def join_sentences(sentences: List[str], separators: List[str]) -> str:
+        """Inverse of `split_with_separators`"""
+        return "".join(sentence + separator for sentence, separator in zip(sentences, separators + [""]))
+
+# The splitter is stateless, so one instance serves every processor and endpoint
+sentence_splitter = SentenceSplitter()
+
+class SentenceResultCache:
+    """Bounded LRU cache of successful sentence results keyed by (author, sentence, paragraph), expiring after `ttl_seconds`.
+    
+    Concurrent lookups of the same key are coalesced: the first caller claims the key and the rest
+    wait for it to `put` or `release`, so identical sentences in flight reach FinChat only once.
+    
+    With `path`, results are also written through to a SQLite file and read back on a memory miss.
+    """
+    def __init__(self, max_entries: int = SENTENCE_CACHE_MAX_ENTRIES, path: Optional[str] = None, ttl_seconds: float = SENTENCE_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[Any, Any]]]" = OrderedDict()  # key -> (stored_at, result)
+        self._pending: Dict[bytes, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            try:
+                self._db = sqlite3.connect(path, check_same_thread=False)  # Only used under self._lock
+                self._db.execute("CREATE TABLE IF NOT EXISTS sentence_results (key BLOB PRIMARY KEY, stored_at REAL NOT NULL, result BLOB NOT NULL)")
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning("⚠️ Sentence cache file %s unavailable, caching in memory only: %s", path, e)
+                self._db = None
+    
+    @staticmethod
+    def make_key(sentence: str, paragraph: str, author: str) -> bytes:
+        """Hash the inputs so long paragraphs don't bloat the key space"""
+        return hashlib.blake2b(f"{author}\x1f{sentence}\x1f{paragraph}".encode('utf-8'), digest_size=16).digest()
+    
+    def get_or_claim(self, key: bytes) -> Optional[Dict[Any, Any]]:
+        """Return a shallow copy of the cached result (marked `cached`), or None once the caller owns the key.
+        
+        A caller that gets None must follow up with `put` or `release`.
+        """
+        while True:
+            with self._lock:
+                fresh_after = time.time() - self.ttl_seconds
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] < fresh_after:
+                    del self._entries[key]
+                    entry = None
+                if entry is None and self._db is not None:
+                    entry = self._load(key, fresh_after)
+                    if entry is not None:
+                        self._remember(key, *entry)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    return {**entry[1], "cached": True}
+                pending = self._pending.get(key)
+                if pending is None:
+                    self._pending[key] = threading.Event()
+                    return None
+            # Another thread is already asking FinChat; re-check once it finishes
+            pending.wait()
+    
+    def put(self, key: bytes, result: Dict[Any, Any]) -> None:
+        """Store a result, evicting the least recently used entry past `max_entries`, and release the key"""
+        stored_at = time.time()
+        with self._lock:
+            self._remember(key, stored_at, result)
+            if self._db is not None:
+                self._store(key, stored_at, result)
+        self.release(key)
+    
+    def _remember(self, key: bytes, stored_at: float, result: Dict[Any, Any]) -> None:
+        """Insert into the in-memory LRU; caller holds the lock"""
+        self._entries[key] = (stored_at, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def _load(self, key: bytes, fresh_after: float) -> Optional[Tuple[float, Dict[Any, Any]]]:
+        """Read a (stored_at, result) entry stored after `fresh_after` back from the SQLite file; caller holds the lock"""
+        try:
+            row = self._db.execute(
+                "SELECT stored_at, result FROM sentence_results WHERE key = ? AND stored_at >= ?", (key, fresh_after)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("⚠️ Sentence cache read failed: %s", e)
+            return None
+        return (row[0], orjson.loads(row[1])) if row else None
+    
+    def _store(self, key: bytes, stored_at: float, result: Dict[Any, Any]) -> None:
+        """Write a result through to the SQLite file; caller holds the lock"""
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sentence_results (key, stored_at, result) VALUES (?, ?, ?)",
+                (key, stored_at, orjson.dumps(result)),
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning("⚠️ Sentence cache write failed: %s", e)
+    
+    def release(self, key: bytes) -> None:
+        """Give up a claimed key without caching, waking any waiters"""
+        with self._lock:
+            pending = self._pending.pop(key, None)
+        if pending is not None:
+            pending.set()
+
+# Module-level so warm workers keep hits across requests
+sentence_cache = SentenceResultCache(path=SENTENCE_CACHE_PATH)
+
+# One pool for every parallel paragraph, so requests reuse threads instead of starting their own
+sentence_executor = ThreadPoolExecutor(max_workers=SENTENCE_EXECUTOR_WORKERS, thread_name_prefix="writeaid")
 
 class WriteAidProcessor:
-    def __init__(self, max_workers: int = 1):  # Sequential processing to avoid 60s Vercel timeout
-        self.splitter = SentenceSplitter()
-        self.client = FinChatClient()
-        self.max_workers = max_workers
-        self.author = "EB White"
-        self.logs = []  # Store logs to send to frontend
+    author = DEFAULT_AUTHOR
+    
+    def __init__(self):
+        self.splitter = sentence_splitter
+        self.logs: "deque[str]" = deque(maxlen=PROCESSOR_LOG_MAX_LINES)  # Store logs to send to frontend
+        self.client = FinChatClient(self.logs)
     
     def process_sentence(self, target_sentence: str, sentence_index: int, current_paragraph: str) -> Dict[Any, Any]:
         """Process a single sentence with default author (for backward compatibility)"""
         return self.process_sentence_with_author(target_sentence, sentence_index, current_paragraph, self.author)
     
-    def process_sentence_with_author(self, target_sentence: str, sentence_index: int, current_paragraph: str, author: str) -> Dict[Any, Any]:
-        """Process a single sentence with current paragraph context using specified author"""
+    def process_sentence_with_author(self, target_sentence: str, sentence_index: int, current_paragraph: str, author: str, session_id: Optional[str] = None) -> Dict[Any, Any]:
+        """Process a single sentence with current paragraph context using specified author, reusing `session_id` if given"""
+        cache_key = SentenceResultCache.make_key(target_sentence, current_paragraph, author)
+        cached_result = sentence_cache.get_or_claim(cache_key)
+        if cached_result is not None:
+            self.logs.append(f"♻️ Cache hit for sentence {sentence_index + 1} with author '{author}', skipping FinChat")
+            cached_result["sentence_index"] = sentence_index
+            return cached_result
+        
         try:
             self.logs.append(f"🔄 Processing sentence {sentence_index + 1} with author '{author}': {target_sentence[:50]}...")
             
-            # Create session
-            session_id = self.client.create_session()
-            
-            # Send request with single sentence and current paragraph using specified author
-            self.client.send_write_aid_request(session_id, target_sentence, current_paragraph, author)
-            
-            # Wait for completion
-            self.client.wait_till_idle(session_id)
-            
-            # Get result
-            result = self.client.get_result(session_id)
+            # One round trip when FinChat offers the aggregate endpoint
+            aggregate = self.client.run_write_aid(target_sentence, current_paragraph, author, session_id)
+            if aggregate is not None:
+                session_id, result = aggregate
+            else:
+                # Reuse the paragraph's session when one is supplied, otherwise create a fresh one
+                if session_id is None:
+                    session_id = self.client.create_session()
+                
+                # Send request with single sentence and current paragraph using specified author
+                chat_id = self.client.send_write_aid_request(session_id, target_sentence, current_paragraph, author)
+                
+                # Get result (polls until the chat has a result_id, which implies the session is idle)
+                result = self.client.get_result(session_id, chat_id=chat_id)
             
             # Extract improved sentence from the analysis result
             improved_sentence = self.client.extract_improved_sentence(result) if result else None
             
             self.logs.append(f"✅ Completed sentence {sentence_index + 1} with author '{author}': {improved_sentence[:50] if improved_sentence else 'No improvement'}")
             
-            return {
+            sentence_result = {
                 "sentence_index": sentence_index,
                 "sentence": target_sentence,
                 "improved_sentence": improved_sentence,
@@ -266,7 +762,16 @@ class WriteAidProcessor:
                 "success": True
             }
             
+            # Only cache real improvements so transient FinChat misses are retried next time
+            if improved_sentence:
+                sentence_cache.put(cache_key, dict(sentence_result))
+            else:
+                sentence_cache.release(cache_key)
+            
+            return sentence_result
+            
         except Exception as e:
+            sentence_cache.release(cache_key)
             error_msg = f"❌ Error processing sentence {sentence_index + 1} with author '{author}': {str(e)}"
             self.logs.append(error_msg)
             return {
@@ -278,50 +783,133 @@ class WriteAidProcessor:
                 "success": False
             }
     
-    def process_paragraph(self, paragraph: str, processing_direction: str = 'first-to-last', reprocessing_rounds: int = 0, initial_author: str = 'EB White', reprocessing_author: str = 'EB White') -> Dict[str, Any]:
-        """Process entire paragraph sentence by sentence with progressive paragraph updating"""
+    def process_sentences_batch(self, sentences: List[str], paragraph: str, author: str) -> Optional[List[Dict[Any, Any]]]:
+        """Process every sentence against the same paragraph in one FinChat call; None to fall back to per-sentence calls.
+        
+        Uses the cache the way process_sentence_with_author does: cached sentences are served from it, and the
+        rest are claimed before the call and then `put` or released. Repeated sentences are sent once.
+        """
+        if self.client.batch_supported is False:
+            return None
+        results: List[Optional[Dict[Any, Any]]] = [None] * len(sentences)
+        indexes_by_key: Dict[bytes, List[int]] = {}
+        for i, sentence in enumerate(sentences):
+            indexes_by_key.setdefault(SentenceResultCache.make_key(sentence, paragraph, author), []).append(i)
+        claimed: Dict[bytes, List[int]] = {}
+        # Claim in key order so two batches over the same sentences never each hold a key the other is waiting on
+        for key in sorted(indexes_by_key):
+            cached_result = sentence_cache.get_or_claim(key)
+            if cached_result is None:
+                claimed[key] = indexes_by_key[key]
+            else:
+                for i in indexes_by_key[key]:
+                    results[i] = {**cached_result, "sentence_index": i}
+        if not claimed:
+            return results
+        
+        pending = sorted(claimed.items(), key=lambda item: item[1][0])  # Send in paragraph order
+        stored = set()
+        try:
+            batch = self.client.run_write_aid_batch([sentences[indexes[0]] for _, indexes in pending], paragraph, author)
+            if batch is None:
+                return None
+            session_id, analyses = batch
+            for (key, indexes), result in zip(pending, analyses):
+                improved_sentence = self.client.extract_improved_sentence(result) if result else None
+                sentence_result = {
+                    "sentence_index": indexes[0],
+                    "sentence": sentences[indexes[0]],
+                    "improved_sentence": improved_sentence,
+                    "session_id": session_id,
+                    "session_url": f"https://finchat.adgo.dev/?session_id={session_id}",
+                    "analysis": result,
+                    "author_used": author,
+                    "success": True
+                }
+                if improved_sentence:
+                    sentence_cache.put(key, dict(sentence_result))
+                    stored.add(key)
+                results[indexes[0]] = sentence_result
+                for i in indexes[1:]:
+                    results[i] = {**sentence_result, "sentence_index": i, "cached": True}
+        except Exception as e:
+            self.logs.append(f"⚠️ Batch write-aid failed, processing sentences one by one: {str(e)}")
+            return None
+        finally:
+            # `put` already released the stored keys; release only our own remaining claims
+            for key in claimed.keys() - stored:
+                sentence_cache.release(key)
+        return results
+    
+    def process_sentences_parallel(self, sentences: List[str], paragraph: str, author: str) -> Iterator[Dict[Any, Any]]:
+        """Process every sentence concurrently against the same paragraph, yielding results as they finish.
+        
+        A single batch call is tried first, since every sentence sees the same paragraph anyway.
+        """
+        batch = self.process_sentences_batch(sentences, paragraph, author)
+        if batch is not None:
+            yield from batch
+            return
+        # Keep at most PARALLEL_MAX_WORKERS of this paragraph's sentences in the shared pool, topping up as each finishes
+        remaining = iter(enumerate(sentences))
+        in_flight = set()
+        for i, sentence in remaining:
+            in_flight.add(sentence_executor.submit(self.process_sentence_with_author, sentence, i, paragraph, author))
+            if len(in_flight) >= PARALLEL_MAX_WORKERS:
+                break
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+                following = next(remaining, None)
+                if following is not None:
+                    i, sentence = following
+                    in_flight.add(sentence_executor.submit(self.process_sentence_with_author, sentence, i, paragraph, author))
+    
+    def process_paragraph(self, paragraph: str, processing_direction: str = 'first-to-last', reprocessing_rounds: int = 0, initial_author: str = DEFAULT_AUTHOR, reprocessing_author: str = DEFAULT_AUTHOR, parallel: bool = False) -> Dict[str, Any]:
+        """Process entire paragraph sentence by sentence with progressive paragraph updating, or each round concurrently if `parallel`"""
         import time
         
         # Record processing start time
         processing_start_time = time.time()
         
-        original_sentences = self.splitter.split_paragraph(paragraph)
-        self.logs = []  # Reset logs for this request
-        self.client = FinChatClient(self.logs)  # Pass logs to client
+        # Split once; the sentence list and separators stay authoritative across rounds and the paragraph is rebuilt from them
+        current_sentences, separators = self.splitter.split_with_separators(paragraph)  # A fresh list, updated in place
+        sentence_count = len(current_sentences)
+        # A lone sentence sees the same paragraph either way, so skip the thread pool and batch probe parallel mode would add
+        parallel = parallel and sentence_count > 1
+        self.logs = deque(maxlen=PROCESSOR_LOG_MAX_LINES)  # Reset logs for this request
+        self.client.log_collector = self.logs  # Keep the same client (and its pooled session) across paragraphs
         
         self.logs.append(f"⏱️ Starting processing at {processing_start_time}")
         
-        # Smart sentence limiting based on Vercel 60s timeout
-        # Each sentence takes ~30-40 seconds, so we can safely do 1-2 sentences
-        max_sentences_safe = 1  # Conservative limit to avoid 504 timeouts
-        
-        self.logs.append(f"📊 Found {len(original_sentences)} sentences")
+        self.logs.append(f"📊 Found {sentence_count} sentences")
         
-        if len(original_sentences) > max_sentences_safe:
-            self.logs.append(f"⚠️ Vercel has 60s timeout limit. Processing first {max_sentences_safe} sentence(s) to avoid 504 errors.")
-            self.logs.append(f"💡 For complete analysis, use smaller paragraphs or run locally with backend/app.py")
-            original_sentences = original_sentences[:max_sentences_safe]
+        # Each sentence takes ~30-40 seconds, so sequential multi-sentence paragraphs can outrun Vercel's 60s limit.
+        # Long paragraphs belong on the backend's /api/analyze-async job endpoint, which runs off the request path.
+        if not parallel and sentence_count > 1:
+            self.logs.append("⚠️ Vercel has a 60s timeout limit and this paragraph may exceed it.")
+            self.logs.append("💡 For long paragraphs, use the backend's /api/analyze-async endpoint or pass \"parallel\": true")
         
-        self.logs.append(f"📝 Processing {len(original_sentences)} sentence(s) with progressive paragraph updating")
+        self.logs.append(f"📝 Processing {sentence_count} sentence(s) with progressive paragraph updating")
         self.logs.append(f"🔄 Processing direction: {processing_direction}")
         self.logs.append(f"🔄 Reprocessing rounds: {reprocessing_rounds}")
         self.logs.append(f"🚀 Starting sequential processing with progressive context updates")
         
         if reprocessing_rounds > 0:
-            total_processing_time = len(original_sentences) * (1 + reprocessing_rounds)
+            total_processing_time = sentence_count * (1 + reprocessing_rounds)
             self.logs.append(f"🔄 With {reprocessing_rounds} reprocessing round(s), this will process {total_processing_time} sentences total.")
         
         # Initialize tracking variables for all rounds
         current_paragraph = paragraph  # Start with original paragraph
         all_rounds_results = []  # Store results from all rounds
+        paragraph_session_id = None  # One FinChat session is shared by every sentence in the paragraph
         
         # Process initial round + reprocessing rounds
         for round_num in range(1 + reprocessing_rounds):
             self.logs.append(f"🚀 Starting processing round {round_num + 1}/{1 + reprocessing_rounds}")
             
-            # For each round, split the current paragraph (which may have been improved)
-            current_sentences = self.splitter.split_paragraph(current_paragraph)
-            round_results = []
+            round_results = [None] * len(current_sentences)  # Indexed by sentence, whatever the processing direction
             
             # Determine processing order based on direction
             if processing_direction == 'last-to-first':
@@ -335,33 +923,57 @@ class WriteAidProcessor:
             current_author = initial_author if round_num == 0 else reprocessing_author
             self.logs.append(f"Round {round_num + 1}: Using author '{current_author}' for this round")
             
-            # Process sentences sequentially (no concurrent processing for progressive updates)
-            for processing_order, i in enumerate(processing_indices):
-                target_sentence = current_sentences[i]
-                self.logs.append(f"🎯 Round {round_num + 1}: Processing sentence {i + 1} (order {processing_order + 1}/{len(current_sentences)}) with updated paragraph context")
-                
-                # Process the sentence with current paragraph context using the appropriate author
-                result = self.process_sentence_with_author(target_sentence, i, current_paragraph, current_author)
-                # Add round information to the result
-                result['round'] = round_num + 1
-                result['is_reprocessing'] = round_num > 0
-                round_results.append(result)
-                
-                # If we got an improved sentence, update the paragraph for next iteration
-                if result['success'] and result['improved_sentence']:
-                    old_sentence = current_sentences[i]
-                    new_sentence = result['improved_sentence']
-                    
-                    # Replace the sentence in the current paragraph
-                    current_paragraph = current_paragraph.replace(old_sentence, new_sentence, 1)
+            if parallel:
+                # Every sentence sees the paragraph as it stood at the start of the round, so the whole round can run at once
+                self.logs.append(f"⚡ Round {round_num + 1}: Processing {len(current_sentences)} sentences in parallel")
+                round_paragraph = current_paragraph
+                for result in self.process_sentences_parallel(current_sentences, round_paragraph, current_author):
+                    i = result['sentence_index']
+                    result['round'] = round_num + 1
+                    result['is_reprocessing'] = round_num > 0
+                    round_results[i] = result
+                    if result['success'] and result['improved_sentence']:
+                        current_sentences[i] = result['improved_sentence']
+                # Nothing in the round reads the paragraph, so rebuild it once at the end
+                current_paragraph = self.splitter.join_sentences(current_sentences, separators)
+                # Parallel sentences each ran in their own FinChat session
+                paragraph_session_id = None
+            else:
+                # Process sentences sequentially (no concurrent processing for progressive updates)
+                improved_in_round: Dict[str, Dict[Any, Any]] = {}  # First successful rewrite of each sentence text this round
+                for processing_order, i in enumerate(processing_indices):
+                    target_sentence = current_sentences[i]
+                    self.logs.append(f"🎯 Round {round_num + 1}: Processing sentence {i + 1} (order {processing_order + 1}/{len(current_sentences)}) with updated paragraph context")
                     
-                    # Update the current sentences list
-                    current_sentences[i] = new_sentence
+                    # A sentence repeated within the paragraph takes the rewrite its first occurrence got
+                    earlier = improved_in_round.get(target_sentence)
+                    if earlier is not None:
+                        self.logs.append(f"♻️ Round {round_num + 1}: Sentence {i + 1} repeats an earlier sentence, reusing its rewrite")
+                        result = {**earlier, "sentence_index": i, "cached": True}
+                    else:
+                        # Process the sentence with current paragraph context using the appropriate author
+                        result = self.process_sentence_with_author(target_sentence, i, current_paragraph, current_author, paragraph_session_id)
+                    # Keep the session for the next sentence; start a new one after a failure
+                    if not result.get('cached'):
+                        paragraph_session_id = result.get('session_id') if result['success'] else None
+                    # Add round information to the result
+                    result['round'] = round_num + 1
+                    result['is_reprocessing'] = round_num > 0
+                    round_results[i] = result
                     
-                    self.logs.append(f"🔄 Round {round_num + 1}: Updated paragraph with improved sentence {i + 1}")
-                    self.logs.append(f"📝 Next sentences will use updated context")
-                else:
-                    self.logs.append(f"⚠️ Round {round_num + 1}: No improvement for sentence {i + 1}, keeping original for context")
+                    # If we got an improved sentence, update the paragraph for next iteration
+                    if result['success'] and result['improved_sentence']:
+                        new_sentence = result['improved_sentence']
+                        improved_in_round.setdefault(target_sentence, result)
+                        
+                        # Update the sentence list and rebuild the paragraph around it
+                        current_sentences[i] = new_sentence
+                        current_paragraph = self.splitter.join_sentences(current_sentences, separators)
+                        
+                        self.logs.append(f"🔄 Round {round_num + 1}: Updated paragraph with improved sentence {i + 1}")
+                        self.logs.append(f"📝 Next sentences will use updated context")
+                    else:
+                        self.logs.append(f"⚠️ Round {round_num + 1}: No improvement for sentence {i + 1}, keeping original for context")
             
             # Store results for this round
             all_rounds_results.append({
@@ -373,7 +985,8 @@ class WriteAidProcessor:
             
             self.logs.append(f"✅ Completed processing round {round_num + 1}/{1 + reprocessing_rounds}")
         
-        # Flatten all results for backward compatibility, but keep the last round as primary
+        # Flatten all results for backward compatibility, but keep the last round as primary.
+        # Results are stored by sentence index, so they are already in order.
         final_round_results = all_rounds_results[-1]['results'] if all_rounds_results else []
         
         # Calculate total processing time
@@ -381,38 +994,40 @@ class WriteAidProcessor:
         total_processing_time = processing_end_time - processing_start_time
         self.logs.append(f"⏱️ Processing completed in {total_processing_time:.2f} seconds")
         
-        # Sort results by sentence index (should already be sorted, but for consistency)
-        sorted_results = sorted(final_round_results, key=lambda x: x["sentence_index"])
+        # Tally successes and collect session URLs in one pass
+        session_urls = [r["session_url"] for r in final_round_results if r["success"]]
+        sentences_processed = len(session_urls)
+        sentences_failed = len(final_round_results) - sentences_processed
         
         return {
             "original_paragraph": paragraph,
             "final_paragraph": current_paragraph,  # The progressively updated paragraph
-            "sentence_results": sorted_results,
-            "total_sentences": len(original_sentences),
-            "successful_analyses": len([r for r in sorted_results if r["success"]]),
-            "failed_analyses": len([r for r in sorted_results if not r["success"]]),
-            "session_urls": [r["session_url"] for r in sorted_results if r["success"]],
+            "sentence_results": final_round_results,
+            "total_sentences": sentence_count,
+            "successful_analyses": sentences_processed,
+            "failed_analyses": sentences_failed,
+            "session_urls": session_urls,
             "reprocessing_rounds": reprocessing_rounds,
             "all_rounds_results": all_rounds_results,  # New: detailed results from all rounds
             "processing_time_seconds": total_processing_time,  # New: actual backend processing time
             "summary": {
-                "processing_success_rate": len([r for r in sorted_results if r["success"]]) / len(sorted_results) * 100 if sorted_results else 0,
-                "sentences_processed": len([r for r in sorted_results if r["success"]]),
-                "sentences_failed": len([r for r in sorted_results if not r["success"]]),
+                "processing_success_rate": sentences_processed / len(final_round_results) * 100 if final_round_results else 0,
+                "sentences_processed": sentences_processed,
+                "sentences_failed": sentences_failed,
                 "paragraph_updated": current_paragraph != paragraph,
                 "total_rounds_processed": len(all_rounds_results),
                 "processing_time_seconds": total_processing_time
             },
-            "logs": self.logs
+            "logs": list(self.logs)
         }
 
 class handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Every response sets Content-Length, so connections can be kept alive
+    
     def do_OPTIONS(self):
         """Handle CORS preflight"""
         self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_headers(PREFLIGHT_HEADERS)
         self.end_headers()
     
     def do_POST(self):
@@ -424,15 +1039,18 @@ class handler(BaseHTTPRequestHandler):
             
             # Parse JSON
             try:
-                data = json.loads(post_data.decode('utf-8'))
-            except json.JSONDecodeError:
+                data = orjson.loads(post_data)  # Parses the raw bytes; no separate UTF-8 decode pass
+            except orjson.JSONDecodeError:
                 self.send_error_response(400, "Invalid JSON")
                 return
             
             # Validate input
-            if not data or 'paragraph' not in data:
+            if not isinstance(data, dict) or 'paragraph' not in data:
                 self.send_error_response(400, "Missing 'paragraph' in request body")
                 return
+            if not isinstance(data['paragraph'], str):
+                self.send_error_response(400, "Invalid paragraph. Must be a string")
+                return
             
             paragraph = data['paragraph'].strip()
             if not paragraph:
@@ -447,36 +1065,47 @@ class handler(BaseHTTPRequestHandler):
             
             # Get reprocessing rounds (default to 0 for backward compatibility)
             reprocessing_rounds = data.get('reprocessing_rounds', 0)
-            if not isinstance(reprocessing_rounds, int) or reprocessing_rounds < 0 or reprocessing_rounds > 1:
+            if not isinstance(reprocessing_rounds, int) or isinstance(reprocessing_rounds, bool) or reprocessing_rounds < 0 or reprocessing_rounds > 1:
                 self.send_error_response(400, "Invalid reprocessing_rounds. Must be 0 or 1")
                 return
             
             # Get author names (default to EB White for backward compatibility)
-            initial_author = data.get('initial_author', 'EB White').strip()
-            reprocessing_author = data.get('reprocessing_author', 'EB White').strip()
+            if not isinstance(data.get('initial_author', ''), str) or not isinstance(data.get('reprocessing_author', ''), str):
+                self.send_error_response(400, "Invalid initial_author/reprocessing_author. Must be a string")
+                return
+            initial_author = data.get('initial_author', DEFAULT_AUTHOR).strip()
+            reprocessing_author = data.get('reprocessing_author', DEFAULT_AUTHOR).strip()
             if not initial_author:
-                initial_author = 'EB White'
+                initial_author = DEFAULT_AUTHOR
             if not reprocessing_author:
-                reprocessing_author = 'EB White'
+                reprocessing_author = DEFAULT_AUTHOR
             
-            # Generate unique request ID for tracking
-            request_id = str(uuid.uuid4())
-            logger.info(f"Starting analysis for request {request_id} with direction {processing_direction}, {reprocessing_rounds} reprocessing rounds, authors: {initial_author}/{reprocessing_author}")
+            # Opt-in concurrent rounds (default to progressive, sequential processing)
+            parallel = data.get('parallel', False)
+            if not isinstance(parallel, bool):
+                self.send_error_response(400, "Invalid parallel. Must be true or false")
+                return
             
-            # Process paragraph with adaptive workers based on sentence count
-            splitter = SentenceSplitter()
-            sentences = splitter.split_paragraph(paragraph)
+            # Raw FinChat analysis payloads and the full log are large and optional (default to leaving them out)
+            include_analysis = data.get('include_analysis', False)
+            include_logs = data.get('include_logs', False)
+            if not isinstance(include_analysis, bool) or not isinstance(include_logs, bool):
+                self.send_error_response(400, "Invalid include_analysis/include_logs. Must be true or false")
+                return
             
-            # Sequential processing to stay within Vercel 60s timeout: always 1 worker
-            max_workers = 1
-            logger.info(f"Using {max_workers} worker for {len(sentences)} sentences (Sequential processing for 60s Vercel timeout)")
+            # Generate unique request ID for tracking
+            request_id = str(uuid.uuid4())
+            logger.info("Starting analysis for request %s with direction %s, %s reprocessing rounds, authors: %s/%s", request_id, processing_direction, reprocessing_rounds, initial_author, reprocessing_author)
             
-            processor = WriteAidProcessor(max_workers=max_workers)
-            processing_result = processor.process_paragraph(paragraph, processing_direction, reprocessing_rounds, initial_author, reprocessing_author)
+            # process_paragraph splits the paragraph and logs the sentence count itself, so nothing is split here
+            processor = WriteAidProcessor()
+            processing_result = processor.process_paragraph(paragraph, processing_direction, reprocessing_rounds, initial_author, reprocessing_author, parallel=parallel)
             
             # Extract data from the new format
             sentence_results = processing_result["sentence_results"]
-            logs = processing_result["logs"]
+            if not include_analysis:
+                sentence_results = [{k: v for k, v in r.items() if k != 'analysis'} for r in sentence_results]
+            logs = processing_result["logs"] if include_logs else processing_result["logs"][-RESPONSE_LOG_TAIL_LINES:]
             
             # Generate report using the processing_result data
             report = {
@@ -492,32 +1121,52 @@ class handler(BaseHTTPRequestHandler):
                 "summary": processing_result["summary"]
             }
             
-            logger.info(f"Completed analysis for request {request_id}. Success rate: {report['summary']['processing_success_rate']:.1f}%")
+            logger.info("Completed analysis for request %s. Success rate: %.1f%%", request_id, report['summary']['processing_success_rate'])
             
             # Send successful response
             self.send_success_response(report)
             
         except Exception as e:
-            logger.error(f"Error in analyze_paragraph: {str(e)}")
+            logger.error("Error in analyze_paragraph: %s", e)
             self.send_error_response(500, f"Internal server error: {str(e)}")
     
+    def send_headers(self, headers):
+        """Send a fixed sequence of (name, value) headers"""
+        for name, value in headers:
+            self.send_header(name, value)
+    
     def send_success_response(self, data):
-        """Send successful JSON response"""
-        response = json.dumps(data)
+        """Send successful JSON response, gzip-compressed when the client accepts it"""
+        response = orjson.dumps(data)
+        compress = len(response) >= GZIP_MIN_BYTES and 'gzip' in self.headers.get('Accept-Encoding', '')
+        if compress:
+            # Level 1 gets most of the size win on JSON for a fraction of the CPU of the default level
+            response = gzip.compress(response, compresslevel=1)
         self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_headers(JSON_RESPONSE_HEADERS)
+        self.send_header('Vary', 'Accept-Encoding')
+        if compress:
+            self.send_header('Content-Encoding', 'gzip')
         self.send_header('Content-Length', str(len(response)))
         self.end_headers()
-        self.wfile.write(response.encode('utf-8'))
+        self.wfile.write(response)
     
     def send_error_response(self, status_code, message):
         """Send error JSON response"""
         error_data = {"error": message}
-        response = json.dumps(error_data)
+        response = orjson.dumps(error_data)
         self.send_response(status_code)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_headers(JSON_RESPONSE_HEADERS)
         self.send_header('Content-Length', str(len(response)))
         self.end_headers()
-        self.wfile.write(response.encode('utf-8'))
\ No newline at end of file
+        self.wfile.write(response)
+
+
+# Local serving outside Vercel: one thread per request so a long FinChat poll
+# doesn't queue every other caller behind it
+if __name__ == '__main__':
+    port = int(os.environ.get('PORT', 5001))
+    server = ThreadingHTTPServer(('0.0.0.0', port), handler)
+    server.daemon_threads = True
+    logger.info("🚀 Serving /api/analyze handler on port %d", port)
+    server.serve_forever()
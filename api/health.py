@@ -1,18 +1,22 @@
 from http.server import BaseHTTPRequestHandler
-import json
+import orjson
+
+# The health payload never changes, so serialize it once per cold start
+HEALTH_RESPONSE = orjson.dumps({"status": "healthy", "service": "write-aid-backend"})
 
 class handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Every response sets Content-Length, so connections can be kept alive
+    
     def do_GET(self):
         """Handle GET request for health check"""
-        health_data = {"status": "healthy", "service": "write-aid-backend"}
-        response = json.dumps(health_data)
+        response = HEALTH_RESPONSE
         
         self.send_response(200)
         self.send_header('Content-Type', 'application/json')
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Content-Length', str(len(response)))
         self.end_headers()
-        self.wfile.write(response.encode('utf-8'))
+        self.wfile.write(response)
     
     def do_OPTIONS(self):
         """Handle CORS preflight"""
@@ -20,4 +24,6 @@ class handler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Access-Control-Max-Age', '86400')
+        self.send_header('Content-Length', '0')
         self.end_headers()
\ No newline at end of file
@@ -1,14 +1,40 @@
-from flask import Flask, request, jsonify, make_response
+from flask import Flask, Response, request, jsonify, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import logging
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Callable, Tuple
 import uuid
+import os
+import atexit
+import gzip
+import hashlib
+import sqlite3
+import random
+import reprlib
+import statistics
+import threading
+import queue
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+class ORJSONProvider(JSONProvider):
+    """Parse request bodies and serialize jsonify() output with orjson"""
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
 
 app = Flask(__name__)
-CORS(app, origins=["*"], methods=["GET", "POST", "OPTIONS"], allow_headers=["Content-Type"])  # Enhanced CORS for Railway
+app.json = ORJSONProvider(app)
+# Flask-CORS answers every preflight (routes need no OPTIONS branch); max_age lets browsers reuse one for a day
+CORS(app, origins=["*"], methods=["GET", "POST", "OPTIONS"], allow_headers=["Content-Type"], max_age=86400)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -17,59 +43,289 @@ logger = logging.getLogger(__name__)
 # FinChat API Configuration
 FINCHAT_URL = "https://finchat-api.adgo.dev"
 FINCHAT_BACKOFF_SECONDS = 5
+FINCHAT_POLL_INITIAL_SECONDS = 0.5
+FINCHAT_POLL_MULTIPLIER = 1.5
+FINCHAT_POLL_JITTER = 0.2  # +/- fraction applied to each poll interval
+FINCHAT_CONNECT_TIMEOUT_SECONDS = 5
+FINCHAT_READ_TIMEOUT_SECONDS = 30
+FINCHAT_RESULT_TIMEOUT_SECONDS = 300
+FINCHAT_CIRCUIT_FAILURE_THRESHOLD = 5
+FINCHAT_CIRCUIT_OPEN_SECONDS = 30
+FINCHAT_PROGRESS_LOG_SECONDS = 15  # How often the poll loops report that they are still waiting
+FINCHAT_ERROR_BODY_MAX_BYTES = 2048  # Enough of an error body to diagnose it without logging a whole HTML error page
+FINCHAT_ENDPOINT_MISSING_STATUSES = (404, 405, 501)  # Statuses meaning FinChat doesn't offer an optional endpoint at all
+FINCHAT_RETRY_STATUSES = (429, 500, 502, 503, 504)  # Transient statuses worth trying again
+FINCHAT_LONGPOLL_SECONDS = 55  # Server-side hold time requested from the session wait endpoint
+FINCHAT_LONGPOLL_READ_MARGIN_SECONDS = 5  # Read timeout slack beyond the requested hold
+FINCHAT_POOL_SIZE = int(os.environ.get("FINCHAT_POOL_SIZE", "50"))  # Max keep-alive connections to FinChat
+FINCHAT_MAX_REQUESTS_PER_SECOND = float(os.environ.get("FINCHAT_MAX_REQUESTS_PER_SECOND", "0"))  # 0 disables client-side rate limiting
+# The session wait, write-aid, batch write-aid and single-chat endpoints are not in the documented API;
+# probe them only when asked to, so the default path is the documented session -> chat -> result flow
+FINCHAT_EXPERIMENTAL_ENDPOINTS = os.environ.get("FINCHAT_EXPERIMENTAL_ENDPOINTS", "").lower() in ("1", "true", "yes")
+
+# write-aid-1 command; sentence and paragraph are substituted as JSON string literals so quotes and newlines are escaped
+WRITE_AID_MAGIC_TEMPLATE = 'cot write-aid-1 $sentence:{sentence} $paragraph:{paragraph} $author:{author}'
+
+# Sentence splitting: break after . ! ? unless the period belongs to a common abbreviation
+SENTENCE_ABBREVIATIONS = ("Mr.", "Mrs.", "Ms.", "Dr.", "Prof.", "St.", "vs.", "e.g.", "i.e.")
+SENTENCE_BOUNDARY_RE = re.compile(
+    "".join(rf"(?<!\b{re.escape(abbr)})" for abbr in SENTENCE_ABBREVIATIONS) + r"(?<=[.!?])\s+"
+)
+
+# Sentence result cache configuration
+SENTENCE_CACHE_MAX_ENTRIES = 4096
+SENTENCE_CACHE_TTL_SECONDS = 3600  # Re-ask FinChat after an hour rather than serving a rewrite forever
+SENTENCE_CACHE_PATH = os.environ.get("SENTENCE_CACHE_PATH")  # Optional SQLite file so cached sentences survive restarts
+FINCHAT_ETAG_CACHE_MAX_ENTRIES = 64  # Per-URL validators kept for conditional GETs
+DEFAULT_AUTHOR = "EB White"
+GZIP_MIN_BYTES = 1024  # Smaller JSON bodies aren't worth compressing
+PARALLEL_MAX_WORKERS = 8  # Upper bound on sentences sent to FinChat at once when a paragraph opts into parallel processing
+SENTENCE_EXECUTOR_WORKERS = int(os.environ.get("SENTENCE_EXECUTOR_WORKERS", "16"))  # Threads shared by every parallel paragraph in the worker
+
+def create_http_session(retries: bool = True) -> requests.Session:
+    """Create a keep-alive session so repeated FinChat polls reuse one TCP/TLS connection.
+    
+    With `retries=False` nothing is retried at the transport level, for callers that retry on their own schedule.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,  # Only one host (FinChat) is ever called
+        pool_maxsize=FINCHAT_POOL_SIZE,
+        max_retries=Retry(
+            total=5,
+            connect=3,
+            read=3,
+            status=3,
+            backoff_factor=0.5,
+            status_forcelist=list(FINCHAT_RETRY_STATUSES),
+            # POST stays out: a replayed session/chat create would duplicate work on FinChat
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ) if retries else 0,
+    )
+    session.mount('https://', adapter)
+    session.headers['Accept'] = 'application/json'  # Every FinChat endpoint we call returns JSON
+    return session
+
+# Shared across requests so the connection pool survives for the life of the worker
+http_session = create_http_session()
+atexit.register(http_session.close)  # Close pooled keep-alive sockets cleanly when the worker shuts down
+# Deadline-bound polls go through this one: urllib3's backoff and Retry-After sleeps would carry them past result_timeout
+poll_http_session = create_http_session(retries=False)
+atexit.register(poll_http_session.close)
+
+# Caps in-flight FinChat calls at the pool size so concurrent jobs never open throwaway connections
+finchat_request_slots = threading.BoundedSemaphore(FINCHAT_POOL_SIZE)
+
+# Bounded repr for debug payload logs: stops at the limit instead of rendering a whole paragraph first
+payload_repr = reprlib.Repr()
+payload_repr.maxstring = 200
+payload_repr.maxother = 200
+
+def poll_delays(initial: float = FINCHAT_POLL_INITIAL_SECONDS, maximum: float = FINCHAT_BACKOFF_SECONDS) -> Iterator[float]:
+    """Yield exponentially growing poll intervals: 0.5s -> 0.75s -> 1.125s ... capped at `maximum`.
+    
+    Each interval is jittered so sentences polling concurrently do not hit FinChat in lockstep.
+    """
+    delay = initial
+    while True:
+        yield delay * random.uniform(1 - FINCHAT_POLL_JITTER, 1 + FINCHAT_POLL_JITTER)
+        delay = min(delay * FINCHAT_POLL_MULTIPLIER, maximum)
+
+class FinChatAPIError(ValueError):
+    """FinChat answered with an error status"""
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+class CircuitBreaker:
+    """Fail fast once FinChat has returned too many consecutive 5xx responses or network errors"""
+    def __init__(self, failure_threshold: int = FINCHAT_CIRCUIT_FAILURE_THRESHOLD, open_seconds: float = FINCHAT_CIRCUIT_OPEN_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+    
+    def is_open(self) -> bool:
+        return time.monotonic() < self._open_until
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.failure_threshold:
+                self._open_until = time.monotonic() + self.open_seconds
+                self._consecutive_failures = 0
+                logger.error("🚫 FinChat circuit opened for %ds after %d consecutive failures", self.open_seconds, self.failure_threshold)
+
+# Shared so every request in the worker stops calling FinChat during an outage
+finchat_circuit = CircuitBreaker()
+
+class RateLimiter:
+    """Token bucket pacing FinChat calls to `rate` per second, allowing bursts of up to `burst`; a rate of 0 disables it"""
+    def __init__(self, rate: float = FINCHAT_MAX_REQUESTS_PER_SECOND, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a call may be sent"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+# Shared so concurrent sentences and requests draw from one budget instead of pacing themselves
+finchat_rate_limiter = RateLimiter()
 
 class FinChatClient:
-    def __init__(self):
-        self.base_url = FINCHAT_URL
-        self.backoff_seconds = FINCHAT_BACKOFF_SECONDS
-    
-    def call_remote(self, method: str, full_url: str, **kwargs) -> Dict[Any, Any]:
-        """Generic HTTP caller for FinChat API"""
-        logger.info(f"🌐 FINCHAT API CALL: {method.upper()} {full_url}")
-        if kwargs:
-            logger.info(f"📤 Request payload: {kwargs}")
-        
-        if method == "get":
-            res = requests.get(full_url, params=kwargs)
-        elif method in ["post", "put"]:
-            res = requests.request(method, full_url, json=kwargs)
-        else:
+    base_url = FINCHAT_URL
+    backoff_seconds = FINCHAT_BACKOFF_SECONDS
+    timeout = (FINCHAT_CONNECT_TIMEOUT_SECONDS, FINCHAT_READ_TIMEOUT_SECONDS)
+    result_timeout = FINCHAT_RESULT_TIMEOUT_SECONDS
+    # Each starts off (False) unless FINCHAT_EXPERIMENTAL_ENDPOINTS is set, in which case None means untried
+    longpoll_supported: Optional[bool] = None if FINCHAT_EXPERIMENTAL_ENDPOINTS else False  # Session wait endpoint: None until it first answers, False once ruled out
+    aggregate_supported: Optional[bool] = None if FINCHAT_EXPERIMENTAL_ENDPOINTS else False  # Likewise for the single-call write-aid endpoint
+    chat_detail_supported: Optional[bool] = None if FINCHAT_EXPERIMENTAL_ENDPOINTS else False  # And for the single-chat GET (the documented API only lists a session's chats)
+    batch_supported: Optional[bool] = None if FINCHAT_EXPERIMENTAL_ENDPOINTS else False  # And for the batch write-aid endpoint
+    recent_result_seconds: "deque[float]" = deque(maxlen=16)  # How long recent sessions took to produce a result_id
+    
+    def __init__(self, session: Optional[requests.Session] = None, poll_session: Optional[requests.Session] = None):
+        self.session = session or http_session
+        self.poll_session = poll_session or poll_http_session
+        self.circuit = finchat_circuit
+        self.rate_limiter = finchat_rate_limiter
+        self._paragraph_literal = ("", '""')  # (paragraph, JSON literal) of the last paragraph sent
+        self._etag_cache: "OrderedDict[str, Tuple[str, Dict[Any, Any]]]" = OrderedDict()  # url -> (ETag, parsed body)
+        self._etag_lock = threading.Lock()
+    
+    def call_remote(self, method: str, full_url: str, request_timeout: Optional[Tuple[float, float]] = None, retry: bool = True, **kwargs) -> Dict[Any, Any]:
+        """Generic HTTP caller for FinChat API; `retry=False` skips the transport-level retries"""
+        logger.debug("🌐 FINCHAT API CALL: %s %s", method.upper(), full_url)
+        if kwargs and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📤 Request payload: %s", payload_repr.repr(kwargs))
+        
+        if method not in ["get", "post", "put"]:
             raise ValueError(f"Unsupported method {method}")
         
-        logger.info(f"📥 Response status: {res.status_code}")
+        if self.circuit.is_open():
+            raise RuntimeError(f"FinChat circuit open after repeated failures; skipping {method.upper()} {full_url}")
+        
+        # Revalidate repeated polls of the same URL instead of re-downloading an unchanged body
+        headers = {}
+        cached = self._cached_get(full_url) if method == "get" and not kwargs else None
+        if cached is not None:
+            headers['If-None-Match'] = cached[0]
+        
+        try:
+            self.rate_limiter.acquire()
+            http = self.session if retry else self.poll_session
+            with finchat_request_slots:
+                if method == "get":
+                    res = http.get(full_url, params=kwargs, headers=headers, timeout=request_timeout or self.timeout)
+                else:
+                    res = http.request(method, full_url, json=kwargs, timeout=request_timeout or self.timeout)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            self.circuit.record_failure()
+            raise
+        
+        logger.debug("📥 Response status: %s", res.status_code)
+        
+        if res.status_code >= 500:
+            self.circuit.record_failure()
+        else:
+            self.circuit.record_success()
+        
+        if res.status_code == 304 and cached is not None:
+            return cached[1]
         
         if res.status_code >= 400:
-            logger.error(f"❌ FINCHAT API ERROR: {method} {full_url} failed with status {res.status_code}")
-            logger.error(f"❌ Error response: {res.text}")
-            raise ValueError(f"Failed to call {method} {full_url}:\nstatus:{res.status_code}\n\n{res.text}")
+            # Only decode the body as text on the error path, and only as much of it as is worth logging
+            error_body = res.content[:FINCHAT_ERROR_BODY_MAX_BYTES].decode('utf-8', 'replace')
+            logger.error("❌ FINCHAT API ERROR: %s %s failed with status %s", method, full_url, res.status_code)
+            logger.error("❌ Error response: %s", error_body)
+            raise FinChatAPIError(f"Failed to call {method} {full_url}:\nstatus:{res.status_code}\n\n{error_body}", res.status_code)
         
-        response_data = res.json()
-        logger.info(f"✅ FINCHAT API SUCCESS: {method.upper()} {full_url}")
+        response_data = orjson.loads(res.content)
+        etag = res.headers.get('ETag')
+        if method == "get" and not kwargs and etag:
+            self._store_get(full_url, etag, response_data)
+        logger.debug("✅ FINCHAT API SUCCESS: %s %s", method.upper(), full_url)
         return response_data
     
+    def _cached_get(self, full_url: str) -> Optional[Tuple[str, Dict[Any, Any]]]:
+        """Return the (ETag, body) last seen for this URL, if any"""
+        with self._etag_lock:
+            cached = self._etag_cache.get(full_url)
+            if cached is not None:
+                self._etag_cache.move_to_end(full_url)
+            return cached
+    
+    def _store_get(self, full_url: str, etag: str, response_data: Dict[Any, Any]) -> None:
+        """Remember a GET's validator, evicting the least recently used URL past the cap"""
+        with self._etag_lock:
+            self._etag_cache[full_url] = (etag, response_data)
+            self._etag_cache.move_to_end(full_url)
+            while len(self._etag_cache) > FINCHAT_ETAG_CACHE_MAX_ENTRIES:
+                self._etag_cache.popitem(last=False)
+    
     def call_finchat(self, method: str, path: str, **kwargs) -> Dict[Any, Any]:
         """FinChat-specific wrapper"""
         full_url = f"{self.base_url}{path}"
         return self.call_remote(method, full_url, **kwargs)
     
-    def wait_till_idle(self, session_id: str, log_at_checks: int = 5) -> None:
-        """Wait for session to complete"""
-        logger.info(f"⏳ Waiting for session {session_id} to complete...")
-        check_count = 0
-        while True:
-            session = self.call_finchat(method="get", path=f"/api/v1/sessions/{session_id}/")
-            check_count += 1
-            session_status = session["status"]
-            
-            if session_status == "idle":
-                logger.info(f"✅ Session {session_id} is now idle (completed)")
-                break
-                
-            if check_count % log_at_checks == 0:
-                logger.info("⏳ Continuing to check session %s for idle. Currently %s. (Checked %s times)",
-                           session_id, session_status, check_count)
-            
-            time.sleep(self.backoff_seconds)
+    def wait_till_idle_longpoll(self, session_id: str, deadline: Optional[float] = None) -> bool:
+        """Block on FinChat's session wait endpoint until the session is idle; False if long-polling is unavailable.
+        
+        With `deadline` (a time.monotonic() value), the requested hold and the read timeout both end before it.
+        """
+        if self.longpoll_supported is False:
+            return False
+        read_timeout = FINCHAT_LONGPOLL_SECONDS + FINCHAT_LONGPOLL_READ_MARGIN_SECONDS
+        if deadline is not None:
+            read_timeout = min(read_timeout, deadline - time.monotonic() - FINCHAT_CONNECT_TIMEOUT_SECONDS)
+        hold = int(read_timeout - FINCHAT_LONGPOLL_READ_MARGIN_SECONDS)
+        if hold < 1:
+            return False
+        try:
+            session = self.call_remote(
+                "get", f"{self.base_url}/api/v1/sessions/{session_id}/wait/?timeout={hold}",
+                request_timeout=(FINCHAT_CONNECT_TIMEOUT_SECONDS, read_timeout),
+                retry=False,
+            )
+        except FinChatAPIError as e:
+            if not self.optional_endpoint_missing("longpoll_supported", e):
+                raise
+            logger.info("ℹ️ FinChat session wait endpoint unavailable, falling back to polling")
+            return False
+        FinChatClient.longpoll_supported = True
+        return session.get("status") == "idle"
+    
+    def optional_endpoint_missing(self, flag: str, error: FinChatAPIError) -> bool:
+        """Whether an error from an optional FinChat endpoint means it isn't offered, switching it off for the process if so.
+        
+        Until the endpoint has answered once, any error status counts, since a missing route may answer 400 or 401 rather
+        than 404. Once it has worked, only FINCHAT_ENDPOINT_MISSING_STATUSES do and other errors are the caller's to raise.
+        """
+        if getattr(FinChatClient, flag) and error.status_code not in FINCHAT_ENDPOINT_MISSING_STATUSES:
+            return False
+        setattr(FinChatClient, flag, False)
+        return True
     
     def create_session(self) -> str:
         """Create a new FinChat session"""
@@ -81,23 +337,31 @@ class FinChatClient:
             data_source="alpha_vantage",
         )
         session_id = session["id"]
-        logger.info(f"✨ Created FinChat session: {session_id}")
+        logger.info("✨ Created FinChat session: %s", session_id)
         return session_id
     
-    def send_write_aid_request(self, session_id: str, sentence: str, full_paragraph: str, author: str) -> None:
-        """Send write-aid-1 request with single sentence and full paragraph"""
-        magic_string = (
-            f"cot write-aid-1 "
-            f'$sentence:"{sentence}" '
-            f'$paragraph:"{full_paragraph}" '
-            f"$author:{author}"
+    def paragraph_literal(self, full_paragraph: str) -> str:
+        """JSON-escape the paragraph, reusing the previous literal while the paragraph is unchanged"""
+        # Read and replace the (paragraph, literal) pair as one tuple so concurrent jobs never mix them up
+        cached = self._paragraph_literal
+        if cached[0] != full_paragraph:
+            cached = (full_paragraph, orjson.dumps(full_paragraph).decode('utf-8'))
+            self._paragraph_literal = cached
+        return cached[1]
+    
+    def send_write_aid_request(self, session_id: str, sentence: str, full_paragraph: str, author: str) -> Optional[str]:
+        """Send write-aid-1 request with single sentence and full paragraph; returns the created chat's id"""
+        magic_string = WRITE_AID_MAGIC_TEMPLATE.format(
+            sentence=orjson.dumps(sentence).decode('utf-8'),
+            paragraph=self.paragraph_literal(full_paragraph),
+            author=author,
         )
         
-        logger.info(f"💬 Sending write-aid-1 request to session {session_id}")
-        logger.info(f"📝 Single sentence: {sentence}")
-        logger.info(f"📝 Full paragraph: {full_paragraph[:100]}...")
+        logger.info("💬 Sending write-aid-1 request to session %s", session_id)
+        logger.info("📝 Single sentence: %.50s...", sentence)
+        logger.info("📝 Full paragraph: %.100s...", full_paragraph)
         
-        self.call_finchat(
+        chat = self.call_finchat(
             method="post",
             path="/api/v1/chats/",
             session=session_id,
@@ -105,55 +369,167 @@ class FinChatClient:
             use_live_cot=False,
         )
         
-        logger.info(f"📨 Write-aid request sent to session {session_id}")
+        logger.info("📨 Write-aid request sent to session %s", session_id)
+        return chat.get("id")
+    
+    def run_write_aid(self, sentence: str, full_paragraph: str, author: str, session_id: Optional[str] = None) -> Optional[Tuple[str, Optional[Dict[Any, Any]]]]:
+        """Run create/send/wait/fetch as one call to FinChat's write-aid endpoint; None if the endpoint is unavailable"""
+        if self.aggregate_supported is False:
+            return None
+        payload = {
+            "sentence": sentence,
+            "paragraph": full_paragraph,
+            "author": author,
+            "client_id": "parsec-backtesting",
+            "data_source": "alpha_vantage",
+        }
+        if session_id is not None:
+            payload["session"] = session_id
+        try:
+            response = self.call_remote(
+                "post", f"{self.base_url}/api/v1/write-aid/",
+                request_timeout=(FINCHAT_CONNECT_TIMEOUT_SECONDS, self.result_timeout),
+                **payload,
+            )
+        except FinChatAPIError as e:
+            if not self.optional_endpoint_missing("aggregate_supported", e):
+                raise
+            logger.info("ℹ️ FinChat write-aid endpoint unavailable, falling back to the session/chat/result calls")
+            return None
+        except orjson.JSONDecodeError:
+            response = None
+        # A route that answers 200 with some other body (an error object, a catch-all page) is as good as missing
+        if not isinstance(response, dict) or "session_id" not in response:
+            FinChatClient.aggregate_supported = False
+            logger.info("ℹ️ FinChat write-aid endpoint returned an unexpected body, falling back to the session/chat/result calls")
+            return None
+        FinChatClient.aggregate_supported = True
+        return response["session_id"], response.get("result")
     
-    def get_result(self, session_id: str) -> Optional[Dict[Any, Any]]:
-        """Get analysis result with retry logic"""
-        logger.info(f"🔍 Getting results for session {session_id}")
+    def run_write_aid_batch(self, sentences: List[str], full_paragraph: str, author: str) -> Optional[Tuple[str, List[Optional[Dict[Any, Any]]]]]:
+        """Improve every sentence against the same paragraph in one call; None if the batch endpoint is unavailable"""
+        if self.batch_supported is False:
+            return None
+        try:
+            response = self.call_remote(
+                "post", f"{self.base_url}/api/v1/write-aid/batch/",
+                request_timeout=(FINCHAT_CONNECT_TIMEOUT_SECONDS, self.result_timeout),
+                sentences=sentences,
+                paragraph=full_paragraph,
+                author=author,
+                client_id="parsec-backtesting",
+                data_source="alpha_vantage",
+            )
+        except FinChatAPIError as e:
+            if not self.optional_endpoint_missing("batch_supported", e):
+                raise
+            logger.info("ℹ️ FinChat batch write-aid endpoint unavailable, falling back to one call per sentence")
+            return None
+        except orjson.JSONDecodeError:
+            response = None
+        # As with run_write_aid, only a body that checks out proves the endpoint; anything else rules it out
+        results = response.get("results") if isinstance(response, dict) and "session_id" in response else None
+        if not isinstance(results, list):
+            FinChatClient.batch_supported = False
+            logger.warning("⚠️ Batch write-aid returned %s instead of a result list, falling back", type(results).__name__)
+            return None
+        if len(results) != len(sentences):
+            FinChatClient.batch_supported = False
+            logger.warning("⚠️ Batch write-aid returned %d results for %d sentences, falling back", len(results), len(sentences))
+            return None
+        FinChatClient.batch_supported = True
+        return response["session_id"], results
+    
+    def result_poll_delays(self) -> Iterator[float]:
+        """Poll schedule for get_result, adapted to how long recent sessions took to produce a result"""
+        if not self.recent_result_seconds:
+            yield from poll_delays(maximum=self.backoff_seconds)
+            return
+        typical = statistics.median(self.recent_result_seconds)
+        # Sleep through most of a typical wait, then check at a quarter of it (within the usual bounds)
+        yield 0.8 * typical
+        yield from poll_delays(initial=min(max(FINCHAT_POLL_INITIAL_SECONDS, 0.25 * typical), self.backoff_seconds), maximum=self.backoff_seconds)
+    
+    def poll_latest_chat(self, session_id: str, chat_id: Optional[str], poll_timeout: Tuple[float, float]) -> Dict[Any, Any]:
+        """One get_result poll: our chat (or, without `chat_id`, the session's latest chat), without transport retries"""
+        latest_message = None
+        if chat_id and self.chat_detail_supported is not False:
+            # A single-object fetch stays small however many chats the shared session accumulates
+            try:
+                latest_message = self.call_finchat("get", f"/api/v1/chats/{chat_id}/", request_timeout=poll_timeout, retry=False)
+                FinChatClient.chat_detail_supported = True
+            except FinChatAPIError as e:
+                # Unlike the other optional endpoints, only a missing-route status rules this one out: it is
+                # polled many times per sentence, so a stray 5xx or 401 on the first try shouldn't disable it
+                if e.status_code in FINCHAT_ENDPOINT_MISSING_STATUSES:
+                    FinChatClient.chat_detail_supported = False
+                    logger.info("ℹ️ FinChat chat detail endpoint unavailable, listing session chats instead")
+                elif self.chat_detail_supported:
+                    raise
+                else:
+                    logger.info("ℹ️ FinChat chat detail returned %s, listing session chats for this poll", e.status_code)
+        if latest_message is None:
+            chats = self.call_finchat("get", f"/api/v1/chats/?session_id={session_id}", request_timeout=poll_timeout, retry=False)["results"]
+            # Our chat is the newest one in the session; match on id as well where the listing includes it
+            latest_message = next((chat for chat in chats if chat_id and chat.get("id") == chat_id), chats[-1] if chats else {})
+        return latest_message
+    
+    def get_result(self, session_id: str, log_every_seconds: float = FINCHAT_PROGRESS_LOG_SECONDS, chat_id: Optional[str] = None) -> Optional[Dict[Any, Any]]:
+        """Poll the chat (or, without `chat_id`, the session's latest chat) until a result_id appears, then fetch the analysis"""
+        logger.debug("🔍 Getting results for session %s", session_id)
         
-        max_retries = 5
-        retries = 0
+        check_count = 0
         result_id = None
+        started = time.monotonic()
+        deadline = started + self.result_timeout
+        next_progress_log = started + log_every_seconds
         
-        # Get result ID
-        logger.info(f"📋 Fetching chat messages to get result_id...")
-        while retries < max_retries and result_id is None:
-            chat_messages = self.call_finchat("get", f"/api/v1/chats/?session_id={session_id}")
-            if chat_messages["results"]:
-                latest_message = chat_messages["results"][-1]
-                result_id = latest_message.get("result_id")
-                if result_id:
-                    logger.info(f"🎯 Found result_id: {result_id}")
-            if result_id is None:
-                retries += 1
-                logger.warning("⏳ No valid result_id found. Retrying... (%d/%d)", retries, max_retries)
-                time.sleep(15)
+        # Get result ID - its presence means the session finished, so no separate idle wait is needed.
+        # Where FinChat supports it, a long-poll returns as soon as the session is idle so the first chat fetch usually hits.
+        try:
+            self.wait_till_idle_longpoll(session_id, deadline)
+        except Exception as e:
+            logger.warning("⚠️ Session long-poll failed, polling chats instead: %s", e)
+        logger.debug("📋 Polling chat messages for result_id...")
+        delays = self.result_poll_delays()
+        while result_id is None:
+            # No single poll may run past the deadline either
+            poll_timeout = (FINCHAT_CONNECT_TIMEOUT_SECONDS, max(1.0, min(FINCHAT_READ_TIMEOUT_SECONDS, deadline - time.monotonic())))
+            # The loop is the retry: a transient failure just costs this poll rather than sleeping past the deadline
+            try:
+                latest_message = self.poll_latest_chat(session_id, chat_id, poll_timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, FinChatAPIError) as e:
+                if isinstance(e, FinChatAPIError) and e.status_code not in FINCHAT_RETRY_STATUSES:
+                    raise
+                logger.warning("⚠️ Chat poll for session %s failed, retrying at the next poll: %s", session_id, e)
+                latest_message = {}
+            check_count += 1
+            result_id = latest_message.get("result_id")
+            if result_id:
+                logger.debug("🎯 Found result_id: %s", result_id)
+                self.recent_result_seconds.append(time.monotonic() - started)
+                break
+            if time.monotonic() >= deadline:
+                break
+            current_delay = min(next(delays), max(0.0, deadline - time.monotonic()))  # Wake for one last check at the deadline
+            if time.monotonic() >= next_progress_log:
+                next_progress_log = time.monotonic() + log_every_seconds
+                logger.debug("⏳ No result_id yet for session %s. Retrying in %.2f seconds... (Checked %d times)", session_id, current_delay, check_count)
+            time.sleep(current_delay)
         
         if result_id is None:
-            logger.error("❌ Max retries reached. Failed to obtain a valid result_id")
+            logger.error("❌ Timed out after %ds. Failed to obtain a valid result_id", self.result_timeout)
             return None
         
-        # Fetch full analysis
-        logger.info(f"📊 Fetching full analysis for result_id: {result_id}")
-        max_retries = 3
-        retries = 0
-        full_analysis = None
-        
-        while retries < max_retries:
-            try:
-                full_analysis = self.call_finchat("get", f"/api/v1/results/{result_id}/")
-                logger.info(f"✅ Successfully retrieved analysis for result_id: {result_id}")
-                break
-            except Exception as e:
-                retries += 1
-                logger.error("⚠️ Analysis fetch attempt %d/%d failed: %s", retries, max_retries, str(e))
-                if retries < max_retries:
-                    time.sleep(5)
-        
-        if full_analysis is None:
-            logger.error("❌ Failed to fetch analysis after %d retries", max_retries)
+        # Fetch full analysis; transient failures are retried by the session's urllib3 Retry
+        logger.debug("📊 Fetching full analysis for result_id: %s", result_id)
+        try:
+            full_analysis = self.call_finchat("get", f"/api/v1/results/{result_id}/")
+        except Exception as e:
+            logger.error("❌ Failed to fetch analysis for result_id %s: %s", result_id, e)
             return None
         
+        logger.debug("✅ Successfully retrieved analysis for result_id: %s", result_id)
         return full_analysis
     
     def extract_improved_sentence(self, analysis_result: Dict[Any, Any]) -> Optional[str]:
@@ -163,7 +539,7 @@ class FinChatClient:
             if isinstance(analysis_result, dict) and 'content' in analysis_result:
                 improved_sentence = analysis_result['content']
                 if improved_sentence:
-                    logger.info(f"✨ Extracted improved sentence: {improved_sentence}")
+                    logger.info("✨ Extracted improved sentence: %s", improved_sentence)
                     return improved_sentence
                 else:
                     logger.warning("⚠️ Content field is empty")
@@ -173,52 +549,186 @@ class FinChatClient:
                 return None
             
         except Exception as e:
-            logger.error(f"❌ Error extracting improved sentence: {str(e)}")
+            logger.error("❌ Error extracting improved sentence: %s", e)
             return None
 
 class SentenceSplitter:
-    def __init__(self):
-        # Regex pattern for sentence boundaries
-        self.sentence_pattern = r'(?<=[.!?])\s+'
+    sentence_pattern = SENTENCE_BOUNDARY_RE  # Pre-compiled pattern for sentence boundaries
     
     def split_paragraph(self, paragraph: str) -> List[str]:
         """Split paragraph into individual sentences"""
-        sentences = re.split(self.sentence_pattern, paragraph.strip())
-        # Clean and filter empty sentences
-        return [s.strip() for s in sentences if s.strip()]
+        # Boundaries swallow all whitespace between sentences, so the slices need no further stripping
+        return self.split_with_separators(paragraph)[0]
+    
+    def split_with_separators(self, paragraph: str) -> Tuple[List[str], List[str]]:
+        """Split paragraph into sentences plus the whitespace after each boundary, so it can be rebuilt exactly"""
+        paragraph = paragraph.strip()
+        if not paragraph:
+            return [], []
+        sentences, separators, start = [], [], 0
+        for boundary in self.sentence_pattern.finditer(paragraph):
+            sentences.append(paragraph[start:boundary.start()])
+            separators.append(boundary.group())
+            start = boundary.end()
+        sentences.append(paragraph[start:])
+        return sentences, separators
+    
+    @staticmethod
+    def join_sentences(sentences: List[str], separators: List[str]) -> str:
+        """Inverse of `split_with_separators`"""
+        return "".join(sentence + separator for sentence, separator in zip(sentences, separators + [""]))
+
+# The splitter is stateless, so one instance serves every processor and endpoint
+sentence_splitter = SentenceSplitter()
+
+class SentenceResultCache:
+    """Bounded LRU cache of successful sentence results keyed by (author, sentence, paragraph), expiring after `ttl_seconds`.
+    
+    Concurrent lookups of the same key are coalesced: the first caller claims the key and the rest
+    wait for it to `put` or `release`, so identical sentences in flight reach FinChat only once.
+    
+    With `path`, results are also written through to a SQLite file and read back on a memory miss.
+    """
+    def __init__(self, max_entries: int = SENTENCE_CACHE_MAX_ENTRIES, path: Optional[str] = None, ttl_seconds: float = SENTENCE_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[Any, Any]]]" = OrderedDict()  # key -> (stored_at, result)
+        self._pending: Dict[bytes, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            try:
+                self._db = sqlite3.connect(path, check_same_thread=False)  # Only used under self._lock
+                self._db.execute("CREATE TABLE IF NOT EXISTS sentence_results (key BLOB PRIMARY KEY, stored_at REAL NOT NULL, result BLOB NOT NULL)")
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning("⚠️ Sentence cache file %s unavailable, caching in memory only: %s", path, e)
+                self._db = None
+    
+    @staticmethod
+    def make_key(sentence: str, paragraph: str, author: str) -> bytes:
+        """Hash the inputs so long paragraphs don't bloat the key space"""
+        return hashlib.blake2b(f"{author}\x1f{sentence}\x1f{paragraph}".encode('utf-8'), digest_size=16).digest()
+    
+    def get_or_claim(self, key: bytes) -> Optional[Dict[Any, Any]]:
+        """Return a shallow copy of the cached result (marked `cached`), or None once the caller owns the key.
+        
+        A caller that gets None must follow up with `put` or `release`.
+        """
+        while True:
+            with self._lock:
+                fresh_after = time.time() - self.ttl_seconds
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] < fresh_after:
+                    del self._entries[key]
+                    entry = None
+                if entry is None and self._db is not None:
+                    entry = self._load(key, fresh_after)
+                    if entry is not None:
+                        self._remember(key, *entry)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    return {**entry[1], "cached": True}
+                pending = self._pending.get(key)
+                if pending is None:
+                    self._pending[key] = threading.Event()
+                    return None
+            # Another thread is already asking FinChat; re-check once it finishes
+            pending.wait()
+    
+    def put(self, key: bytes, result: Dict[Any, Any]) -> None:
+        """Store a result, evicting the least recently used entry past `max_entries`, and release the key"""
+        stored_at = time.time()
+        with self._lock:
+            self._remember(key, stored_at, result)
+            if self._db is not None:
+                self._store(key, stored_at, result)
+        self.release(key)
+    
+    def _remember(self, key: bytes, stored_at: float, result: Dict[Any, Any]) -> None:
+        """Insert into the in-memory LRU; caller holds the lock"""
+        self._entries[key] = (stored_at, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def _load(self, key: bytes, fresh_after: float) -> Optional[Tuple[float, Dict[Any, Any]]]:
+        """Read a (stored_at, result) entry stored after `fresh_after` back from the SQLite file; caller holds the lock"""
+        try:
+            row = self._db.execute(
+                "SELECT stored_at, result FROM sentence_results WHERE key = ? AND stored_at >= ?", (key, fresh_after)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("⚠️ Sentence cache read failed: %s", e)
+            return None
+        return (row[0], orjson.loads(row[1])) if row else None
+    
+    def _store(self, key: bytes, stored_at: float, result: Dict[Any, Any]) -> None:
+        """Write a result through to the SQLite file; caller holds the lock"""
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sentence_results (key, stored_at, result) VALUES (?, ?, ?)",
+                (key, stored_at, orjson.dumps(result)),
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning("⚠️ Sentence cache write failed: %s", e)
+    
+    def release(self, key: bytes) -> None:
+        """Give up a claimed key without caching, waking any waiters"""
+        with self._lock:
+            pending = self._pending.pop(key, None)
+        if pending is not None:
+            pending.set()
+
+# Module-level so warm workers keep hits across requests
+sentence_cache = SentenceResultCache(path=SENTENCE_CACHE_PATH)
+
+# One pool for every parallel paragraph, so requests reuse threads instead of starting their own
+sentence_executor = ThreadPoolExecutor(max_workers=SENTENCE_EXECUTOR_WORKERS, thread_name_prefix="writeaid")
 
 class WriteAidProcessor:
-    def __init__(self, max_workers: int = 2):  # Reduced to 2 workers to avoid timeouts
-        self.splitter = SentenceSplitter()
+    author = DEFAULT_AUTHOR
+    
+    def __init__(self):
+        self.splitter = sentence_splitter
         self.client = FinChatClient()
-        self.max_workers = max_workers
-        self.author = "EB White"
     
     def process_sentence(self, target_sentence: str, sentence_index: int, current_paragraph: str) -> Dict[Any, Any]:
         """Process a single sentence with default author (for backward compatibility)"""
         return self.process_sentence_with_author(target_sentence, sentence_index, current_paragraph, self.author)
     
-    def process_sentence_with_author(self, target_sentence: str, sentence_index: int, current_paragraph: str, author: str) -> Dict[Any, Any]:
-        """Process a single sentence with current paragraph context using specified author"""
+    def process_sentence_with_author(self, target_sentence: str, sentence_index: int, current_paragraph: str, author: str, session_id: Optional[str] = None) -> Dict[Any, Any]:
+        """Process a single sentence with current paragraph context using specified author, reusing `session_id` if given"""
+        cache_key = SentenceResultCache.make_key(target_sentence, current_paragraph, author)
+        cached_result = sentence_cache.get_or_claim(cache_key)
+        if cached_result is not None:
+            logger.info("♻️ Cache hit for sentence %d with author '%s', skipping FinChat", sentence_index + 1, author)
+            cached_result["sentence_index"] = sentence_index
+            return cached_result
+        
         try:
-            logger.info(f"Processing sentence {sentence_index + 1} with author '{author}': {target_sentence[:50]}...")
-            
-            # Create session
-            session_id = self.client.create_session()
-            
-            # Send request with single sentence and current paragraph using specified author
-            self.client.send_write_aid_request(session_id, target_sentence, current_paragraph, author)
-            
-            # Wait for completion
-            self.client.wait_till_idle(session_id)
+            logger.info("Processing sentence %d with author '%s': %.50s...", sentence_index + 1, author, target_sentence)
             
-            # Get result
-            result = self.client.get_result(session_id)
+            # One round trip when FinChat offers the aggregate endpoint
+            aggregate = self.client.run_write_aid(target_sentence, current_paragraph, author, session_id)
+            if aggregate is not None:
+                session_id, result = aggregate
+            else:
+                # Reuse the paragraph's session when one is supplied, otherwise create a fresh one
+                if session_id is None:
+                    session_id = self.client.create_session()
+                
+                # Send request with single sentence and current paragraph using specified author
+                chat_id = self.client.send_write_aid_request(session_id, target_sentence, current_paragraph, author)
+                
+                # Get result (polls until the chat has a result_id, which implies the session is idle)
+                result = self.client.get_result(session_id, chat_id=chat_id)
             
             # Extract improved sentence from the analysis result
             improved_sentence = self.client.extract_improved_sentence(result) if result else None
             
-            return {
+            sentence_result = {
                 "sentence_index": sentence_index,
                 "sentence": target_sentence,
                 "improved_sentence": improved_sentence,
@@ -229,8 +739,17 @@ class WriteAidProcessor:
                 "success": True
             }
             
+            # Only cache real improvements so transient FinChat misses are retried next time
+            if improved_sentence:
+                sentence_cache.put(cache_key, dict(sentence_result))
+            else:
+                sentence_cache.release(cache_key)
+            
+            return sentence_result
+            
         except Exception as e:
-            logger.error(f"Error processing sentence {sentence_index + 1} with author '{author}': {str(e)}")
+            sentence_cache.release(cache_key)
+            logger.error("Error processing sentence %s with author '%s': %s", sentence_index + 1, author, e)
             return {
                 "sentence_index": sentence_index,
                 "sentence": target_sentence,
@@ -239,82 +758,201 @@ class WriteAidProcessor:
                 "success": False
             }
     
-    def process_paragraph(self, paragraph: str, processing_direction: str = 'first-to-last', reprocessing_rounds: int = 0, initial_author: str = 'EB White', reprocessing_author: str = 'EB White') -> Dict[str, Any]:
-        """Process entire paragraph sentence by sentence with progressive paragraph updating"""
+    def process_sentences_batch(self, sentences: List[str], paragraph: str, author: str) -> Optional[List[Dict[Any, Any]]]:
+        """Process every sentence against the same paragraph in one FinChat call; None to fall back to per-sentence calls.
+        
+        Uses the cache the way process_sentence_with_author does: cached sentences are served from it, and the
+        rest are claimed before the call and then `put` or released. Repeated sentences are sent once.
+        """
+        if self.client.batch_supported is False:
+            return None
+        results: List[Optional[Dict[Any, Any]]] = [None] * len(sentences)
+        indexes_by_key: Dict[bytes, List[int]] = {}
+        for i, sentence in enumerate(sentences):
+            indexes_by_key.setdefault(SentenceResultCache.make_key(sentence, paragraph, author), []).append(i)
+        claimed: Dict[bytes, List[int]] = {}
+        # Claim in key order so two batches over the same sentences never each hold a key the other is waiting on
+        for key in sorted(indexes_by_key):
+            cached_result = sentence_cache.get_or_claim(key)
+            if cached_result is None:
+                claimed[key] = indexes_by_key[key]
+            else:
+                for i in indexes_by_key[key]:
+                    results[i] = {**cached_result, "sentence_index": i}
+        if not claimed:
+            return results
+        
+        pending = sorted(claimed.items(), key=lambda item: item[1][0])  # Send in paragraph order
+        stored = set()
+        try:
+            batch = self.client.run_write_aid_batch([sentences[indexes[0]] for _, indexes in pending], paragraph, author)
+            if batch is None:
+                return None
+            session_id, analyses = batch
+            for (key, indexes), result in zip(pending, analyses):
+                improved_sentence = self.client.extract_improved_sentence(result) if result else None
+                sentence_result = {
+                    "sentence_index": indexes[0],
+                    "sentence": sentences[indexes[0]],
+                    "improved_sentence": improved_sentence,
+                    "session_id": session_id,
+                    "session_url": f"https://finchat.adgo.dev/?session_id={session_id}",
+                    "analysis": result,
+                    "author_used": author,
+                    "success": True
+                }
+                if improved_sentence:
+                    sentence_cache.put(key, dict(sentence_result))
+                    stored.add(key)
+                results[indexes[0]] = sentence_result
+                for i in indexes[1:]:
+                    results[i] = {**sentence_result, "sentence_index": i, "cached": True}
+        except Exception as e:
+            logger.warning("⚠️ Batch write-aid failed, processing sentences one by one: %s", e)
+            return None
+        finally:
+            # `put` already released the stored keys; release only our own remaining claims
+            for key in claimed.keys() - stored:
+                sentence_cache.release(key)
+        return results
+    
+    def process_sentences_parallel(self, sentences: List[str], paragraph: str, author: str) -> Iterator[Dict[Any, Any]]:
+        """Process every sentence concurrently against the same paragraph, yielding results as they finish.
+        
+        A single batch call is tried first, since every sentence sees the same paragraph anyway.
+        """
+        batch = self.process_sentences_batch(sentences, paragraph, author)
+        if batch is not None:
+            yield from batch
+            return
+        # Keep at most PARALLEL_MAX_WORKERS of this paragraph's sentences in the shared pool, topping up as each finishes
+        remaining = iter(enumerate(sentences))
+        in_flight = set()
+        for i, sentence in remaining:
+            in_flight.add(sentence_executor.submit(self.process_sentence_with_author, sentence, i, paragraph, author))
+            if len(in_flight) >= PARALLEL_MAX_WORKERS:
+                break
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+                following = next(remaining, None)
+                if following is not None:
+                    i, sentence = following
+                    in_flight.add(sentence_executor.submit(self.process_sentence_with_author, sentence, i, paragraph, author))
+    
+    def process_paragraph(self, paragraph: str, processing_direction: str = 'first-to-last', reprocessing_rounds: int = 0, initial_author: str = DEFAULT_AUTHOR, reprocessing_author: str = DEFAULT_AUTHOR, on_sentence_result: Optional[Callable[[Dict[Any, Any]], None]] = None, parallel: bool = False) -> Dict[str, Any]:
+        """Process entire paragraph sentence by sentence with progressive paragraph updating.
+        
+        `on_sentence_result`, if given, is called with each sentence result as soon as it completes.
+        With `parallel`, each round sends all of its sentences at once against the paragraph as it stood
+        at the start of the round, trading progressive context for wall-clock time.
+        """
         import time
         
         # Record processing start time
         processing_start_time = time.time()
-        logger.info(f"⏱️ Starting processing at {processing_start_time}")
+        logger.info("⏱️ Starting processing at %s", processing_start_time)
         
-        original_sentences = self.splitter.split_paragraph(paragraph)
-        logger.info(f"Processing {len(original_sentences)} sentences with progressive paragraph updating")
+        # Split once; the sentence list and separators stay authoritative across rounds and the paragraph is rebuilt from them
+        current_sentences, separators = self.splitter.split_with_separators(paragraph)  # A fresh list, updated in place
+        sentence_count = len(current_sentences)
+        # A lone sentence sees the same paragraph either way, so skip the thread pool and batch probe parallel mode would add
+        parallel = parallel and sentence_count > 1
+        logger.info("Processing %s sentences with progressive paragraph updating", sentence_count)
         
         # Process all sentences - no limits (user accepts long processing times)
-        logger.info(f"📊 Processing all {len(original_sentences)} sentences with progressive paragraph updating")
-        logger.info(f"🔄 Processing direction: {processing_direction}")
-        logger.info(f"🔄 Reprocessing rounds: {reprocessing_rounds}")
-        if len(original_sentences) > 5:
-            logger.info(f"⏰ Large paragraph detected ({len(original_sentences)} sentences). This may take 1+ hours to complete.")
-            logger.info(f"🚀 Progressive updating: Each sentence will use improved context from previous sentences.")
+        logger.info("📊 Processing all %s sentences with progressive paragraph updating", sentence_count)
+        logger.info("🔄 Processing direction: %s", processing_direction)
+        logger.info("🔄 Reprocessing rounds: %s", reprocessing_rounds)
+        if sentence_count > 5:
+            logger.info("⏰ Large paragraph detected (%s sentences). This may take 1+ hours to complete.", sentence_count)
+            logger.info("🚀 Progressive updating: Each sentence will use improved context from previous sentences.")
         
         if reprocessing_rounds > 0:
-            total_processing_time = len(original_sentences) * (1 + reprocessing_rounds)
-            logger.info(f"🔄 With {reprocessing_rounds} reprocessing round(s), this will process {total_processing_time} sentences total.")
-            logger.info(f"🔄 REPROCESSING ENABLED: Will run {1 + reprocessing_rounds} total rounds")
+            total_processing_time = sentence_count * (1 + reprocessing_rounds)
+            logger.info("🔄 With %s reprocessing round(s), this will process %s sentences total.", reprocessing_rounds, total_processing_time)
+            logger.info("🔄 REPROCESSING ENABLED: Will run %s total rounds", 1 + reprocessing_rounds)
         
         # Initialize tracking variables for all rounds
         current_paragraph = paragraph  # Start with original paragraph
         all_rounds_results = []  # Store results from all rounds
+        paragraph_session_id = None  # One FinChat session is shared by every sentence in the paragraph
         
         # Process initial round + reprocessing rounds
         for round_num in range(1 + reprocessing_rounds):
-            logger.info(f"🚀 Starting processing round {round_num + 1}/{1 + reprocessing_rounds}")
-            logger.info(f"🔄 ROUND {round_num + 1} DEBUG: Current paragraph length = {len(current_paragraph)} chars")
+            logger.info("🚀 Starting processing round %s/%s", round_num + 1, 1 + reprocessing_rounds)
+            logger.info("🔄 ROUND %s DEBUG: Current paragraph length = %s chars", round_num + 1, len(current_paragraph))
             
-            # For each round, split the current paragraph (which may have been improved)
-            current_sentences = self.splitter.split_paragraph(current_paragraph)
-            round_results = []
+            round_results = [None] * len(current_sentences)  # Indexed by sentence, whatever the processing direction
             
             # Determine processing order based on direction
             if processing_direction == 'last-to-first':
                 processing_indices = list(range(len(current_sentences) - 1, -1, -1))  # Reverse order
-                logger.info(f"🔄 Round {round_num + 1}: Processing sentences in reverse order: {len(current_sentences)} to 1")
+                logger.info("🔄 Round %s: Processing sentences in reverse order: %s to 1", round_num + 1, len(current_sentences))
             else:
                 processing_indices = list(range(len(current_sentences)))  # Forward order
-                logger.info(f"🔄 Round {round_num + 1}: Processing sentences in forward order: 1 to {len(current_sentences)}")
+                logger.info("🔄 Round %s: Processing sentences in forward order: 1 to %s", round_num + 1, len(current_sentences))
             
             # Determine which author to use for this round
             current_author = initial_author if round_num == 0 else reprocessing_author
-            logger.info(f"Round {round_num + 1}: Using author '{current_author}' for this round")
+            logger.info("Round %s: Using author '%s' for this round", round_num + 1, current_author)
             
-            # Process sentences sequentially (no concurrent processing for progressive updates)
-            for processing_order, i in enumerate(processing_indices):
-                target_sentence = current_sentences[i]
-                logger.info(f"Round {round_num + 1}: Processing sentence {i + 1} (order {processing_order + 1}/{len(current_sentences)}) with updated paragraph context")
-                
-                # Process the sentence with current paragraph context using the appropriate author
-                result = self.process_sentence_with_author(target_sentence, i, current_paragraph, current_author)
-                # Add round information to the result
-                result['round'] = round_num + 1
-                result['is_reprocessing'] = round_num > 0
-                round_results.append(result)
-                
-                # If we got an improved sentence, update the paragraph for next iteration
-                if result['success'] and result['improved_sentence']:
-                    old_sentence = current_sentences[i]
-                    new_sentence = result['improved_sentence']
-                    
-                    # Replace the sentence in the current paragraph
-                    current_paragraph = current_paragraph.replace(old_sentence, new_sentence, 1)
+            if parallel:
+                # Every sentence sees the paragraph as it stood at the start of the round, so the whole round can run at once
+                logger.info("⚡ Round %s: Processing %s sentences in parallel", round_num + 1, len(current_sentences))
+                round_paragraph = current_paragraph
+                for result in self.process_sentences_parallel(current_sentences, round_paragraph, current_author):
+                    i = result['sentence_index']
+                    result['round'] = round_num + 1
+                    result['is_reprocessing'] = round_num > 0
+                    round_results[i] = result
+                    if on_sentence_result:
+                        on_sentence_result(result)
+                    if result['success'] and result['improved_sentence']:
+                        current_sentences[i] = result['improved_sentence']
+                # Nothing in the round reads the paragraph, so rebuild it once at the end
+                current_paragraph = self.splitter.join_sentences(current_sentences, separators)
+                # Parallel sentences each ran in their own FinChat session
+                paragraph_session_id = None
+            else:
+                # Process sentences sequentially (no concurrent processing for progressive updates)
+                improved_in_round: Dict[str, Dict[Any, Any]] = {}  # First successful rewrite of each sentence text this round
+                for processing_order, i in enumerate(processing_indices):
+                    target_sentence = current_sentences[i]
+                    logger.info("Round %d: Processing sentence %d (order %d/%d) with updated paragraph context", round_num + 1, i + 1, processing_order + 1, len(current_sentences))
                     
-                    # Update the current sentences list
-                    current_sentences[i] = new_sentence
+                    # A sentence repeated within the paragraph takes the rewrite its first occurrence got
+                    earlier = improved_in_round.get(target_sentence)
+                    if earlier is not None:
+                        logger.info("Round %d: Sentence %d repeats an earlier sentence, reusing its rewrite", round_num + 1, i + 1)
+                        result = {**earlier, "sentence_index": i, "cached": True}
+                    else:
+                        # Process the sentence with current paragraph context using the appropriate author
+                        result = self.process_sentence_with_author(target_sentence, i, current_paragraph, current_author, paragraph_session_id)
+                    # Keep the session for the next sentence; start a new one after a failure
+                    if not result.get('cached'):
+                        paragraph_session_id = result.get('session_id') if result['success'] else None
+                    # Add round information to the result
+                    result['round'] = round_num + 1
+                    result['is_reprocessing'] = round_num > 0
+                    round_results[i] = result
+                    if on_sentence_result:
+                        on_sentence_result(result)
                     
-                    logger.info(f"Round {round_num + 1}: Updated paragraph with improved sentence {i + 1}")
-                    logger.info(f"Next sentences will use updated context")
-                else:
-                    logger.info(f"Round {round_num + 1}: No improvement for sentence {i + 1}, keeping original for context")
+                    # If we got an improved sentence, update the paragraph for next iteration
+                    if result['success'] and result['improved_sentence']:
+                        new_sentence = result['improved_sentence']
+                        improved_in_round.setdefault(target_sentence, result)
+                        
+                        # Update the sentence list and rebuild the paragraph around it
+                        current_sentences[i] = new_sentence
+                        current_paragraph = self.splitter.join_sentences(current_sentences, separators)
+                        
+                        logger.info("Round %d: Updated paragraph with improved sentence %d", round_num + 1, i + 1)
+                        logger.info("Next sentences will use updated context")
+                    else:
+                        logger.info("Round %d: No improvement for sentence %d, keeping original for context", round_num + 1, i + 1)
             
             # Store results for this round
             all_rounds_results.append({
@@ -324,41 +962,151 @@ class WriteAidProcessor:
                 'paragraph_after_round': current_paragraph
             })
             
-            logger.info(f"✅ Completed processing round {round_num + 1}/{1 + reprocessing_rounds}")
-            logger.info(f"🔄 ROUND {round_num + 1} RESULT: Paragraph is now {len(current_paragraph)} chars")
+            logger.info("✅ Completed processing round %s/%s", round_num + 1, 1 + reprocessing_rounds)
+            logger.info("🔄 ROUND %s RESULT: Paragraph is now %s chars", round_num + 1, len(current_paragraph))
         
-        # Flatten all results for backward compatibility, but keep the last round as primary
+        # Flatten all results for backward compatibility, but keep the last round as primary.
+        # Results are stored by sentence index, so they are already in order.
         final_round_results = all_rounds_results[-1]['results'] if all_rounds_results else []
         
         # Calculate total processing time
         processing_end_time = time.time()
         total_processing_time = processing_end_time - processing_start_time
-        logger.info(f"⏱️ Processing completed in {total_processing_time:.2f} seconds")
+        logger.info("⏱️ Processing completed in %.2f seconds", total_processing_time)
         
-        # Sort results by sentence index (should already be sorted, but for consistency)
-        sorted_results = sorted(final_round_results, key=lambda x: x["sentence_index"])
+        # Tally successes and collect session URLs in one pass
+        session_urls = [r["session_url"] for r in final_round_results if r["success"]]
+        sentences_processed = len(session_urls)
+        sentences_failed = len(final_round_results) - sentences_processed
         
         return {
             "original_paragraph": paragraph,
             "final_paragraph": current_paragraph,  # The progressively updated paragraph
-            "sentence_results": sorted_results,
-            "total_sentences": len(original_sentences),
-            "successful_analyses": len([r for r in sorted_results if r["success"]]),
-            "failed_analyses": len([r for r in sorted_results if not r["success"]]),
-            "session_urls": [r["session_url"] for r in sorted_results if r["success"]],
+            "sentence_results": final_round_results,
+            "total_sentences": sentence_count,
+            "successful_analyses": sentences_processed,
+            "failed_analyses": sentences_failed,
+            "session_urls": session_urls,
             "reprocessing_rounds": reprocessing_rounds,
             "all_rounds_results": all_rounds_results,  # New: detailed results from all rounds
             "processing_time_seconds": total_processing_time,  # New: actual backend processing time
             "summary": {
-                "processing_success_rate": len([r for r in sorted_results if r["success"]]) / len(sorted_results) * 100 if sorted_results else 0,
-                "sentences_processed": len([r for r in sorted_results if r["success"]]),
-                "sentences_failed": len([r for r in sorted_results if not r["success"]]),
+                "processing_success_rate": sentences_processed / len(final_round_results) * 100 if final_round_results else 0,
+                "sentences_processed": sentences_processed,
+                "sentences_failed": sentences_failed,
                 "paragraph_updated": current_paragraph != paragraph,
                 "total_rounds_processed": len(all_rounds_results),
                 "processing_time_seconds": total_processing_time
             }
         }
 
+def json_response(data: Any, status_code: int = 200) -> Response:
+    """Serialize with orjson straight to bytes instead of going through Flask's jsonify, gzip-compressed when accepted"""
+    body = orjson.dumps(data)
+    compress = len(body) >= GZIP_MIN_BYTES and 'gzip' in request.accept_encodings
+    if compress:
+        # Level 1 gets most of the size win on JSON for a fraction of the CPU of the default level
+        body = gzip.compress(body, compresslevel=1)
+    response = Response(body, status=status_code, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    if compress:
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+def parse_analyze_request(data: Optional[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Validate an analyze request body, returning (options, None) or (None, error message)"""
+    if not isinstance(data, dict) or 'paragraph' not in data:
+        return None, "Missing 'paragraph' in request body"
+    if not isinstance(data['paragraph'], str):
+        return None, "Invalid paragraph. Must be a string"
+    
+    paragraph = data['paragraph'].strip()
+    if not paragraph:
+        return None, "Paragraph cannot be empty"
+    
+    # Get processing direction (default to first-to-last for backward compatibility)
+    processing_direction = data.get('processing_direction', 'first-to-last')
+    if processing_direction not in ['first-to-last', 'last-to-first']:
+        return None, "Invalid processing_direction. Must be 'first-to-last' or 'last-to-first'"
+    
+    # Get reprocessing rounds (default to 0 for backward compatibility)
+    reprocessing_rounds = data.get('reprocessing_rounds', 0)
+    if not isinstance(reprocessing_rounds, int) or isinstance(reprocessing_rounds, bool) or reprocessing_rounds < 0 or reprocessing_rounds > 1:
+        return None, "Invalid reprocessing_rounds. Must be 0 or 1"
+    
+    # Get author names (default to EB White for backward compatibility)
+    if not isinstance(data.get('initial_author', ''), str) or not isinstance(data.get('reprocessing_author', ''), str):
+        return None, "Invalid initial_author/reprocessing_author. Must be a string"
+    initial_author = data.get('initial_author', DEFAULT_AUTHOR).strip() or DEFAULT_AUTHOR
+    reprocessing_author = data.get('reprocessing_author', DEFAULT_AUTHOR).strip() or DEFAULT_AUTHOR
+    
+    # Opt-in concurrent rounds (default to progressive, sequential processing)
+    parallel = data.get('parallel', False)
+    if not isinstance(parallel, bool):
+        return None, "Invalid parallel. Must be true or false"
+    
+    # Raw FinChat analysis payloads are large and optional (default to leaving them out)
+    include_analysis = data.get('include_analysis', False)
+    if not isinstance(include_analysis, bool):
+        return None, "Invalid include_analysis. Must be true or false"
+    
+    return {
+        "paragraph": paragraph,
+        "processing_direction": processing_direction,
+        "reprocessing_rounds": reprocessing_rounds,
+        "initial_author": initial_author,
+        "reprocessing_author": reprocessing_author,
+        "parallel": parallel,
+        "include_analysis": include_analysis,
+    }, None
+
+def without_analysis(sentence_result: Dict[Any, Any]) -> Dict[Any, Any]:
+    """Copy a sentence result without its raw FinChat `analysis` (the improved sentence and session URL remain)"""
+    return {k: v for k, v in sentence_result.items() if k != 'analysis'}
+
+def compact_processing_result(processing_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Strip `analysis` from every sentence result, including the per-round copies"""
+    return {
+        **processing_result,
+        "sentence_results": [without_analysis(r) for r in processing_result["sentence_results"]],
+        "all_rounds_results": [
+            {**round_result, "results": [without_analysis(r) for r in round_result["results"]]}
+            for round_result in processing_result["all_rounds_results"]
+        ],
+    }
+
+def iter_processing_events(options: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Run process_paragraph on a worker thread and yield a `sentence_result` event per finished sentence, then `summary` or `error`"""
+    events = queue.Queue()
+    
+    def run():
+        try:
+            processing_result = processor.process_paragraph(
+                options["paragraph"], options["processing_direction"], options["reprocessing_rounds"],
+                options["initial_author"], options["reprocessing_author"],
+                parallel=options["parallel"],
+                on_sentence_result=lambda sentence_result: events.put({
+                    "type": "sentence_result",
+                    "result": sentence_result if options["include_analysis"] else without_analysis(sentence_result),
+                }),
+            )
+            # Sentence results were already streamed, so the summary only carries the paragraph-level fields
+            summary = {k: v for k, v in processing_result.items() if k not in ("sentence_results", "all_rounds_results")}
+            events.put({"type": "summary", "result": summary})
+        except Exception as e:
+            logger.error("❌ Streaming analysis failed: %s", e)
+            events.put({"type": "error", "error": str(e)})
+    
+    worker = threading.Thread(target=run)
+    worker.daemon = True
+    worker.start()
+    
+    while True:
+        event = events.get()
+        yield event
+        if event["type"] != "sentence_result":
+            break
+
 # Global processor instance
 processor = WriteAidProcessor()
 
@@ -375,62 +1123,49 @@ def health_check():
 # In-memory storage for async job results
 job_results = {}
 
-@app.route('/api/analyze-async', methods=['POST', 'OPTIONS'])
+@app.route('/api/analyze-async', methods=['POST'])
 def analyze_paragraph_async():
     """Start paragraph analysis asynchronously and return job ID"""
-    # Handle CORS preflight
-    if request.method == 'OPTIONS':
-        response = make_response()
-        response.headers['Access-Control-Allow-Origin'] = '*'
-        response.headers['Access-Control-Allow-Methods'] = 'POST, OPTIONS'
-        response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
-        return response
-        
     try:
         logger.info("📥 Received async analyze request")
-        data = request.get_json()
+        data = request.get_json(silent=True)
         
-        if not data or 'paragraph' not in data:
-            return jsonify({"error": "Missing 'paragraph' in request body"}), 400
-        
-        paragraph = data['paragraph'].strip()
-        if not paragraph:
-            return jsonify({"error": "Paragraph cannot be empty"}), 400
-        
-        # Get processing direction (default to first-to-last for backward compatibility)
-        processing_direction = data.get('processing_direction', 'first-to-last')
-        if processing_direction not in ['first-to-last', 'last-to-first']:
-            return jsonify({"error": "Invalid processing_direction. Must be 'first-to-last' or 'last-to-first'"}), 400
-        
-        # Get reprocessing rounds (default to 0 for backward compatibility)
-        reprocessing_rounds = data.get('reprocessing_rounds', 0)
-        if not isinstance(reprocessing_rounds, int) or reprocessing_rounds < 0 or reprocessing_rounds > 1:
-            return jsonify({"error": "Invalid reprocessing_rounds. Must be 0 or 1"}), 400
-        
-        # Get author names (default to EB White for backward compatibility)
-        initial_author = data.get('initial_author', 'EB White').strip()
-        reprocessing_author = data.get('reprocessing_author', 'EB White').strip()
-        if not initial_author:
-            initial_author = 'EB White'
-        if not reprocessing_author:
-            reprocessing_author = 'EB White'
+        options, error = parse_analyze_request(data)
+        if error:
+            return jsonify({"error": error}), 400
+        paragraph = options["paragraph"]
+        processing_direction = options["processing_direction"]
+        reprocessing_rounds = options["reprocessing_rounds"]
+        initial_author = options["initial_author"]
+        reprocessing_author = options["reprocessing_author"]
+        parallel = options["parallel"]
+        include_analysis = options["include_analysis"]
         
         # Generate job ID
         job_id = str(uuid.uuid4())
         
         # Store job as "processing"
-        job_results[job_id] = {"status": "processing", "progress": f"Starting analysis ({processing_direction}, {reprocessing_rounds} reprocessing rounds)..."}
+        job_results[job_id] = {"status": "processing", "progress": f"Starting analysis ({processing_direction}, {reprocessing_rounds} reprocessing rounds)...", "partial_results": []}
         
         # Start processing in background thread
-        import threading
+        def record_partial_result(sentence_result):
+            # Publish each finished sentence so /api/job/<job_id> can report progress before the job completes.
+            # Appended in place: the list only grows, and pollers fetch just the entries past their `since` offset.
+            job = job_results[job_id]
+            partial_results = job["partial_results"]
+            partial_results.append(sentence_result if include_analysis else without_analysis(sentence_result))
+            job["progress"] = f"Round {sentence_result['round']}: completed {len(partial_results)} sentence result(s)"
+        
         def process_in_background():
             try:
-                processing_result = processor.process_paragraph(paragraph, processing_direction, reprocessing_rounds, initial_author, reprocessing_author)
+                processing_result = processor.process_paragraph(paragraph, processing_direction, reprocessing_rounds, initial_author, reprocessing_author, on_sentence_result=record_partial_result, parallel=parallel)
+                if not include_analysis:
+                    processing_result = compact_processing_result(processing_result)
                 job_results[job_id] = {"status": "completed", "result": processing_result}
-                logger.info(f"✅ Background job {job_id} completed successfully")
+                logger.info("✅ Background job %s completed successfully", job_id)
             except Exception as e:
                 job_results[job_id] = {"status": "failed", "error": str(e)}
-                logger.error(f"❌ Background job {job_id} failed: {str(e)}")
+                logger.error("❌ Background job %s failed: %s", job_id, e)
         
         thread = threading.Thread(target=process_in_background)
         thread.daemon = True
@@ -439,73 +1174,58 @@ def analyze_paragraph_async():
         return jsonify({"job_id": job_id, "status": "started", "message": "Analysis started in background"})
         
     except Exception as e:
-        logger.error(f"Error starting async analysis: {str(e)}")
+        logger.error("Error starting async analysis: %s", e)
         return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
 @app.route('/api/job/<job_id>', methods=['GET'])
 def get_job_status(job_id):
-    """Get status of background job"""
+    """Get status of background job; `?since=N` skips the first N partial results the client already has"""
     if job_id not in job_results:
         return jsonify({"error": "Job not found"}), 404
     
     job_data = job_results[job_id]
-    response = jsonify(job_data)
-    response.headers['Access-Control-Allow-Origin'] = '*'
-    return response
+    if "partial_results" in job_data:
+        since = max(0, request.args.get('since', 0, type=int))
+        partial_results = job_data["partial_results"]
+        total = len(partial_results)  # Taken before slicing so a concurrent append isn't skipped by the next poll
+        job_data = {**job_data, "partial_results": partial_results[since:total], "partial_results_total": total}
+    return json_response(job_data)
 
-@app.route('/api/analyze', methods=['POST', 'OPTIONS'])
+@app.route('/api/analyze', methods=['POST'])
 def analyze_paragraph():
     """Analyze a paragraph using Write Aid"""
-    # Handle CORS preflight
-    if request.method == 'OPTIONS':
-        response = make_response()
-        response.headers['Access-Control-Allow-Origin'] = '*'
-        response.headers['Access-Control-Allow-Methods'] = 'POST, OPTIONS'
-        response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
-        return response
     try:
         logger.info("📥 Received analyze request")
-        data = request.get_json()
-        logger.info(f"📋 Request data: {data}")
-        
-        if not data or 'paragraph' not in data:
-            logger.error("❌ Missing paragraph in request")
-            return jsonify({"error": "Missing 'paragraph' in request body"}), 400
-        
-        paragraph = data['paragraph'].strip()
-        if not paragraph:
-            return jsonify({"error": "Paragraph cannot be empty"}), 400
-        
-        # Get processing direction (default to first-to-last for backward compatibility)
-        processing_direction = data.get('processing_direction', 'first-to-last')
-        if processing_direction not in ['first-to-last', 'last-to-first']:
-            return jsonify({"error": "Invalid processing_direction. Must be 'first-to-last' or 'last-to-first'"}), 400
+        data = request.get_json(silent=True)
+        logger.debug("📋 Request data: %s", data)
         
-        # Get reprocessing rounds (default to 0 for backward compatibility)
-        reprocessing_rounds = data.get('reprocessing_rounds', 0)
-        if not isinstance(reprocessing_rounds, int) or reprocessing_rounds < 0 or reprocessing_rounds > 1:
-            return jsonify({"error": "Invalid reprocessing_rounds. Must be 0 or 1"}), 400
+        options, error = parse_analyze_request(data)
+        if error:
+            return jsonify({"error": error}), 400
+        paragraph = options["paragraph"]
+        processing_direction = options["processing_direction"]
+        reprocessing_rounds = options["reprocessing_rounds"]
+        initial_author = options["initial_author"]
+        reprocessing_author = options["reprocessing_author"]
+        parallel = options["parallel"]
+        include_analysis = options["include_analysis"]
         
-        # Get author names (default to EB White for backward compatibility)
-        initial_author = data.get('initial_author', 'EB White').strip()
-        reprocessing_author = data.get('reprocessing_author', 'EB White').strip()
-        if not initial_author:
-            initial_author = 'EB White'
-        if not reprocessing_author:
-            reprocessing_author = 'EB White'
+        # Clients that ask for NDJSON (or pass ?stream=1) get each sentence as it finishes instead of one report at the end
+        if request.args.get('stream') == '1' or request.accept_mimetypes.best == 'application/x-ndjson':
+            logger.info("📡 Streaming analyze response as NDJSON")
+            return processing_event_stream(options)
         
         # Generate unique request ID for tracking
         request_id = str(uuid.uuid4())
-        logger.info(f"Starting analysis for request {request_id} with direction {processing_direction}, {reprocessing_rounds} reprocessing rounds, authors: {initial_author}/{reprocessing_author}")
+        logger.info("Starting analysis for request %s with direction %s, %s reprocessing rounds, authors: %s/%s", request_id, processing_direction, reprocessing_rounds, initial_author, reprocessing_author)
         
         # Process paragraph
-        processing_result = processor.process_paragraph(paragraph, processing_direction, reprocessing_rounds, initial_author, reprocessing_author)
+        processing_result = processor.process_paragraph(paragraph, processing_direction, reprocessing_rounds, initial_author, reprocessing_author, parallel=parallel)
         
         # Extract sentence results for compatibility
         sentence_results = processing_result["sentence_results"]
-        successful_analyses = [r for r in sentence_results if r["success"]]
-        failed_analyses = [r for r in sentence_results if not r["success"]]
-        
+        if not include_analysis:
+            sentence_results = [without_analysis(r) for r in sentence_results]
         report = {
             "request_id": request_id,
             "original_paragraph": processing_result["original_paragraph"],
@@ -518,36 +1238,62 @@ def analyze_paragraph():
             "summary": processing_result["summary"]
         }
         
-        logger.info(f"Completed analysis for request {request_id}. Success rate: {report['summary']['processing_success_rate']:.1f}%")
+        logger.info("Completed analysis for request %s. Success rate: %.1f%%", request_id, report['summary']['processing_success_rate'])
         
         # Create response with proper headers for Railway and long-running requests
-        response = jsonify(report)
-        response.headers['Access-Control-Allow-Origin'] = '*'
-        response.headers['Access-Control-Allow-Methods'] = 'POST, OPTIONS'
-        response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
+        response = json_response(report)
         response.headers['Connection'] = 'keep-alive'
         response.headers['Cache-Control'] = 'no-cache'
         return response
         
     except Exception as e:
-        logger.error(f"Error in analyze_paragraph: {str(e)}")
+        logger.error("Error in analyze_paragraph: %s", e)
         return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
+@app.route('/api/analyze-stream', methods=['POST'])
+def analyze_paragraph_stream():
+    """Analyze a paragraph and stream one event per finished sentence, then a summary event.
+    
+    Events are NDJSON lines by default, or Server-Sent Events when the client sends `Accept: text/event-stream`.
+    """
+    logger.info("📥 Received streaming analyze request")
+    options, error = parse_analyze_request(request.get_json(silent=True))
+    if error:
+        return jsonify({"error": error}), 400
+    
+    use_sse = request.accept_mimetypes.best_match(['application/x-ndjson', 'text/event-stream']) == 'text/event-stream'
+    return processing_event_stream(options, use_sse)
+
+def processing_event_stream(options: Dict[str, Any], use_sse: bool = False) -> Response:
+    """Stream iter_processing_events as NDJSON lines, or as Server-Sent Events when use_sse is set"""
+    def generate():
+        for event in iter_processing_events(options):
+            if use_sse:
+                yield b"event: " + event["type"].encode() + b"\ndata: " + orjson.dumps(event) + b"\n\n"
+            else:
+                yield orjson.dumps(event) + b"\n"
+    
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream' if use_sse else 'application/x-ndjson')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # Stop reverse proxies from buffering the stream
+    return response
+
 @app.route('/api/split-sentences', methods=['POST'])
 def split_sentences():
     """Split a paragraph into sentences (utility endpoint)"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
         
-        if not data or 'paragraph' not in data:
+        if not isinstance(data, dict) or 'paragraph' not in data:
             return jsonify({"error": "Missing 'paragraph' in request body"}), 400
+        if not isinstance(data['paragraph'], str):
+            return jsonify({"error": "Invalid paragraph. Must be a string"}), 400
         
         paragraph = data['paragraph'].strip()
         if not paragraph:
             return jsonify({"error": "Paragraph cannot be empty"}), 400
         
-        splitter = SentenceSplitter()
-        sentences = splitter.split_paragraph(paragraph)
+        sentences = sentence_splitter.split_paragraph(paragraph)
         
         return jsonify({
             "paragraph": paragraph,
@@ -556,14 +1302,13 @@ def split_sentences():
         })
         
     except Exception as e:
-        logger.error(f"Error in split_sentences: {str(e)}")
+        logger.error("Error in split_sentences: %s", e)
         return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
 # For Railway deployment, the app needs to be available at module level
 # Railway will call this directly
 if __name__ == '__main__':
-    import os
     port = int(os.environ.get('PORT', 5001))
-    logger.info(f"🚀 Starting Flask app on port {port}")
-    logger.info(f"📋 Registered routes: {[rule.rule for rule in app.url_map.iter_rules()]}")
+    logger.info("🚀 Starting Flask app on port %s", port)
+    logger.info("📋 Registered routes: %s", [rule.rule for rule in app.url_map.iter_rules()])
     app.run(debug=False, host='0.0.0.0', port=port)
@@ -19,6 +19,7 @@ function App() {
   const [showCompletionNotification, setShowCompletionNotification] = useState(false);
   const [processingStartTime, setProcessingStartTime] = useState(null);
   const [processingDuration, setProcessingDuration] = useState(null);
+  const [progressMessage, setProgressMessage] = useState(null);
 
   // Format duration in a human-readable way (now accepts seconds instead of milliseconds)
   const formatDuration = (seconds) => {
@@ -89,6 +90,7 @@ function App() {
     setError(null);
     setResults(null);
     setProcessingDuration(null);
+    setProgressMessage(null);
     // Record start time
     const startTime = Date.now();
     console.log(`⏱️ Recording start time: ${startTime}`);
@@ -101,7 +103,8 @@ function App() {
         processing_direction: processingDirection,
         reprocessing_rounds: reprocessingRounds,
         initial_author: initialAuthor.trim(),
-        reprocessing_author: reprocessingAuthor.trim()
+        reprocessing_author: reprocessingAuthor.trim(),
+        include_analysis: true // Shown in the per-sentence analysis preview
       }, {
         timeout: 30000, // 30 second timeout for starting the job
         headers: {
@@ -115,9 +118,11 @@ function App() {
 
       // Poll for results
       const pollForResults = async () => {
+        let loggedPartialResults = 0;
         while (true) {
           try {
             const statusResponse = await axios.get(`${API_BASE_URL}/api/job/${jobId}`, {
+              params: { since: loggedPartialResults }, // Only fetch sentence results not seen yet
               timeout: 10000 // 10 second timeout for status checks
             });
 
@@ -152,9 +157,15 @@ function App() {
               setError(jobData.error || 'Analysis failed');
               break;
             } else {
-              // Still processing, wait and poll again
+              // Still processing, show per-sentence progress and poll again
               console.log(`⏳ Status: ${jobData.status} - ${jobData.progress || 'Processing...'}`);
-              await new Promise(resolve => setTimeout(resolve, 5000)); // Wait 5 seconds
+              const partialResults = jobData.partial_results || [];
+              partialResults.forEach((partial) => {
+                console.log(`✏️ Sentence ${partial.sentence_index + 1}: ${partial.improved_sentence || partial.sentence}`);
+              });
+              loggedPartialResults = jobData.partial_results_total ?? loggedPartialResults + partialResults.length;
+              setProgressMessage(jobData.progress || null);
+              await new Promise(resolve => setTimeout(resolve, 1000)); // Wait 1 second
             }
           } catch (pollErr) {
             console.error('Polling error:', pollErr);
@@ -171,6 +182,7 @@ function App() {
       setError(err.response?.data?.error || 'Failed to start analysis. Please try again.');
     } finally {
       setIsAnalyzing(false);
+      setProgressMessage(null);
     }
   };
 
@@ -335,7 +347,7 @@ function App() {
                 {isAnalyzing ? (
                   <>
                     <span className="spinner"></span>
-                    Analyzing...
+                    {progressMessage ? `Analyzing... ${progressMessage}` : 'Analyzing...'}
                   </>
                 ) : (
                   'Analyze Writing'